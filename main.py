@@ -1,18 +1,31 @@
-from src.core.exchange_conn import ExchangeConn
+import asyncio
+
+from src.core.exchange_conn import close_exchange, get_exchange
 from src.core.manage_orders import ManageOrders
 from src.core.state_chief import StateChief
+from src.core.state_feed import StateFeed
 from src.utils.market_hours import MarketHoursChecker
 
 
-def main():
+async def main():
     """Inicializa e executa o robô de trading."""
-    binance = ExchangeConn().exchange
-    manage_orders = ManageOrders(exchange=binance)
-    hours_checker = MarketHoursChecker()
+    state_feed = None
+    try:
+        binance = await get_exchange()
+        state_feed = StateFeed(exchange=binance)
+        state_feed.start()
+
+        manage_orders = ManageOrders(exchange=binance, state_feed=state_feed)
+        await manage_orders.initialize()
+        hours_checker = MarketHoursChecker()
 
-    state_chief = StateChief(exchange=binance, manage_orders=manage_orders, hours_checker=hours_checker)
-    state_chief.run()
+        state_chief = StateChief(exchange=binance, manage_orders=manage_orders, hours_checker=hours_checker)
+        await state_chief.run()
+    finally:
+        if state_feed is not None:
+            await state_feed.stop()
+        await close_exchange()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,42 +1,77 @@
+import sys
+
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader  # libyaml (C)
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+REDIS_URL = "redis://redis:6379/0"
+BOT_ENVIRONMENT = {"REDIS_URL": REDIS_URL, "PYTHONOPTIMIZE": "2"}
 
-def generate_compose(pairs_file: str) -> None:
+
+def generate_compose(pairs_file: str, single_process: bool = False) -> None:
     """
     Gera docker-compose.yml a partir da lista de pares.
     Arquivo config/pairs.yml
+
+    Por padrão gera um container por par, cada um com o seu env_file. Com
+    single_process=True gera um único serviço bot-all que executa todos os
+    pares em um processo (scripts/run_all.py); nesse modo cada par lê as
+    próprias configurações de config/<env_file> (load_pair_settings), e os
+    env_files do serviço fornecem apenas os valores comuns (chaves, exchange).
+
+    Inclui um serviço Redis compartilhado (cache de load_markets entre bots).
+    Os bots rodam com PYTHONOPTIMIZE=2 (sem asserts e docstrings em produção).
+
+    O config/_pairs_frozen.py lido pelos bots é gerado no build da imagem
+    (python -m src.utils.pairs), sempre a partir do pairs.yml copiado.
     """
 
     with open(pairs_file, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
-    services = {}
-    volumes = {}
+    # Nome base de cada par calculado uma única vez (ex: BTC/USDT -> btc)
+    pairs = [(pair["symbol"].split("/")[0].lower(), pair["env_file"]) for pair in config["pairs"]]
 
-    for pair in config["pairs"]:
-        name = pair["symbol"].split("/")[0].lower()
-        service_name = f"bot-{name}"
-        volume_name = f"logs-{name}"
-
-        services[service_name] = {
-            "build": ".",
-            "env_file": f"./config/{pair['env_file']}",
-            "volumes": [f"{volume_name}:/app/logs"],
-            "restart": "unless-stopped",
+    if single_process:
+        services = {
+            "bot-all": {
+                "build": ".",
+                "command": ["python", "-m", "scripts.run_all"],
+                "env_file": [f"./config/{env_file}" for _, env_file in pairs],
+                "environment": dict(BOT_ENVIRONMENT),
+                "depends_on": ["redis"],
+                "volumes": ["logs-all:/app/logs"],
+                "restart": "unless-stopped",
+            }
+        }
+        volumes = {"logs-all": None}
+    else:
+        services = {
+            f"bot-{name}": {
+                "build": ".",
+                "env_file": f"./config/{env_file}",
+                "environment": dict(BOT_ENVIRONMENT),
+                "depends_on": ["redis"],
+                "volumes": [f"logs-{name}:/app/logs"],
+                "restart": "unless-stopped",
+            }
+            for name, env_file in pairs
         }
+        volumes = {f"logs-{name}": None for name, _ in pairs}
 
-        volumes[volume_name] = None
+    services["redis"] = {"image": "redis:7-alpine", "restart": "unless-stopped"}
 
-    compose = {
-        "services": services,
-        "volumes": volumes,
-    }
+    compose = {"services": services, "volumes": volumes}
 
     with open("docker-compose.yml", "w") as f:
-        yaml.dump(compose, f, default_flow_style=False)
+        yaml.dump(compose, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
-    print(f"✅ docker-compose.yml gerado com {len(services)} bots")
+    mode = "1 processo" if single_process else f"{len(pairs)} containers"
+    print(f"✅ docker-compose.yml gerado com {len(pairs)} pares ({mode})")
 
 
 if __name__ == "__main__":
-    generate_compose("config/pairs.yml")
+    generate_compose("config/pairs.yml", single_process="--single-process" in sys.argv)
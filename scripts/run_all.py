@@ -0,0 +1,61 @@
+import asyncio
+
+from src.core.exchange_conn import close_exchange, get_exchange
+from src.core.manage_orders import ManageOrders
+from src.core.settings import Settings, load_pair_settings
+from src.core.state_chief import StateChief
+from src.core.state_feed import StateFeed
+from src.utils.market_hours import MarketHoursChecker
+from src.utils.logger import get_logger
+from src.utils.pairs import load_pairs
+
+_log_run_all = get_logger("bot.run_all")
+
+
+async def run_pair(exchange, symbol: str, pair_settings: Settings) -> None:
+    """
+    Executa a máquina de estados de um par sobre a exchange compartilhada.
+
+    Falhas ficam restritas ao par: são registradas e a tarefa termina sem
+    interromper os demais pares.
+    """
+    state_feed = StateFeed(exchange=exchange, symbol=symbol)
+    state_feed.start()
+    try:
+        manage_orders = ManageOrders(exchange=exchange, state_feed=state_feed, symbol=symbol, pair_settings=pair_settings)
+        await manage_orders.initialize()
+
+        hours_checker = MarketHoursChecker(pair_settings=pair_settings)
+        state_chief = StateChief(
+            exchange=exchange, manage_orders=manage_orders, hours_checker=hours_checker, symbol=symbol, pair_settings=pair_settings
+        )
+        await state_chief.run()
+    except Exception as exc:
+        _log_run_all.critical("Par %s encerrado por erro: %s", symbol, exc, exc_info=True)
+    finally:
+        await state_feed.stop()
+
+
+async def run_all() -> None:
+    """
+    Executa todos os pares configurados em um único processo asyncio.
+
+    Uma única instância da exchange (conexão, mercados e sessão HTTP) é
+    compartilhada por todos os pares, em vez de um container por par. Cada
+    par usa as configurações do seu arquivo em config/ (amount, alavancagem,
+    SL/TP...); chaves e exchange vêm do ambiente do processo.
+    Executar da raiz do projeto: python -m scripts.run_all
+    """
+
+    pairs = [(pair["symbol"], load_pair_settings(f"config/{pair['env_file']}")) for pair in load_pairs()]
+
+    try:
+        exchange = await get_exchange()
+        # return_exceptions: a falha de um par não cancela os demais
+        await asyncio.gather(*(run_pair(exchange, symbol, pair_settings) for symbol, pair_settings in pairs), return_exceptions=True)
+    finally:
+        await close_exchange()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
@@ -1,82 +1,160 @@
-import ccxt
+import asyncio
+import time
+import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
 import logging
-from typing import Optional
+from typing import Any, ClassVar, Dict, Optional
 
 from src.core.settings import settings
 from src.utils.logger import get_logger
+from src.utils.binance_limiter import with_weight_limiter
 from src.utils.ccxt_decorators import handle_ccxt_exceptions
+from src.utils.hmac_signer import with_cached_hmac
+from src.utils.http_session import SharedSessionManager
+from src.utils.redis_memo import redis_memoize
 
 
 class ExchangeConn:
-    """Gerencia conexão com a exchange usando a biblioteca CCXT.
+    """Gerencia conexão com a exchange usando a biblioteca CCXT (async).
 
     Responsabilidades:
     - Criar e autenticar conexão com a exchange configurada.
     - Suportar modo sandbox (testnet) e produção.
     - Testar a conexão automaticamente na inicialização.
+    - Compartilhar uma única sessão HTTP keep-alive (SharedSessionManager).
+    - Usar a classe CCXT Pro da exchange (streams WebSocket via StateFeed).
+    - Manter uma única instância da exchange por processo.
     - Tratar exceções específicas do CCXT para diagnóstico preciso.
 
-    Attributes:
-        exchange (ccxt.Exchange): Instância autenticada da exchange CCXT.
+    Uso:
+        exchange = await get_exchange()
+        ...
+        await close_exchange()
     """
 
+    # Instância única por processo (compartilhada entre todos os ExchangeConn)
+    _shared_exchange: ClassVar[Optional[ccxt.Exchange]] = None
+    _shared_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+    MAX_CLOCK_SKEW_MS: ClassVar[int] = 5000  # Diferença de relógio tolerada antes de alertar
+
     def __init__(self) -> None:
         """Inicializa conexão com a exchange."""
         self._log_exchange: logging.Logger = get_logger("bot.exchange_conn")
-        self._exchange: Optional[ccxt.Exchange] = None
 
         try:
-            """Factory dinâmica para multiplas corretoras"""
-            self._exchange_class = getattr(
-                ccxt, settings.exchange
-            )  # ← retorna a CLASSE
+            """Factory dinâmica para multiplas corretoras (CCXT Pro quando disponível: REST + WebSocket)"""
+            self._exchange_class = with_cached_hmac(
+                getattr(ccxtpro, settings.exchange, None) or getattr(ccxt, settings.exchange)
+            )  # ← retorna a CLASSE (com assinatura HMAC pré-processada)
         except AttributeError as e:
             self._log_exchange.error(
                 f"Exchange '{settings.exchange}' não encontrada no CCXT: {e}"
             )
             raise
 
+        # Binance: limitador por peso real no lugar do espaçamento fixo do CCXT
+        self._use_weight_limiter = settings.exchange.startswith("binance")
+        if self._use_weight_limiter:
+            self._exchange_class = with_weight_limiter(self._exchange_class)
+
     @handle_ccxt_exceptions
-    def _create_ccxt_instance(self) -> ccxt.Exchange:
+    async def _create_ccxt_instance(self) -> ccxt.Exchange:
         """
         Cria e retorna uma instância autenticada da exchange CCXT, usando as configurações globais.
-        Ativa o modo sandbox se configurado.
+        Injeta a sessão HTTP compartilhada, ativa o modo sandbox se configurado
+        e carrega os mercados uma única vez.
         Returns:
             ccxt.Exchange: Instância autenticada da exchange.
         Raises:
             Exception: Se houver erro na criação da instância.
         """
         try:
-            _exchange: ccxt.Exchange = (
-                self._exchange_class(  # ← cria um OBJETO a partir da classe
-                    {
-                        "apiKey": settings.api_key,
-                        "secret": settings.api_secret,
-                        "enableRateLimit": True,
-                        "options": {
-                            "defaultType": settings.market_type,
-                            "adjustForTimeDifference": True,
-                        },
-                        "recvWindow": 60000,
-                    }
-                )
-            )
+            config: Dict[str, Any] = {
+                "apiKey": settings.api_key,
+                "secret": settings.api_secret,
+                "enableRateLimit": not self._use_weight_limiter,
+                "options": {
+                    "defaultType": settings.market_type,
+                    "adjustForTimeDifference": True,
+                },
+                "recvWindow": 60000,
+                "session": SharedSessionManager.get_session(),
+            }
+            _exchange: ccxt.Exchange = self._exchange_class(config)  # ← cria um OBJETO a partir da classe
             # Ativa sandbox se necessário
             if settings.sandbox:
                 _exchange.enable_demo_trading(True)
-
+            # Domínio alternativo da API (a testnet usa sempre os domínios padrão)
+            elif settings.exchange_hostname:
+                self._apply_hostname(_exchange, settings.exchange_hostname)
+
+            loaded = await self._load_markets(_exchange)
+            if not _exchange.markets:
+                # Cache hit: load_markets não foi executado
+                _exchange.set_markets(loaded["markets"], loaded["currencies"])
             return _exchange
 
         except Exception as e:
             self._log_exchange.error(f"Erro ao criar instância da exchange: {e}")
             raise
 
+    def _apply_hostname(self, _exchange: ccxt.Exchange, hostname: str) -> None:
+        """
+        Troca o domínio das URLs da API pelo de EXCHANGE_HOSTNAME.
+
+        Nas exchanges cujas URLs CCXT usam {hostname} (bybit, okx...) basta
+        trocar _exchange.hostname. Na binance/binanceusdm as URLs são fixas
+        (https://fapi.binance.com/...): o domínio atual é substituído em
+        urls["api"] e hostname acompanha, pois get_exceptions_by_url monta
+        "https://fapi." + hostname para classificar os erros por URL.
+        Sem nenhum dos dois formatos, a configuração é ignorada com aviso.
+        """
+        _api_urls = _exchange.urls.get("api")
+        _current = getattr(_exchange, "hostname", None)
+
+        if "{hostname}" in str(_api_urls):
+            _exchange.hostname = hostname
+        elif _current and _current in str(_api_urls):
+            _exchange.urls["api"] = self._replace_domain(_api_urls, _current, hostname)
+            _exchange.hostname = hostname
+        else:
+            self._log_exchange.warning(f"EXCHANGE_HOSTNAME ignorado: URLs de {settings.exchange} não usam um domínio configurável.")
+            return
+
+        self._log_exchange.info(f"API de {settings.exchange} via {hostname}")
+
+    @classmethod
+    def _replace_domain(cls, urls: Any, old: str, new: str) -> Any:
+        """Substitui o domínio em todas as URLs (str ou dicts aninhados de urls["api"])."""
+        if isinstance(urls, str):
+            return urls.replace(old, new)
+        if isinstance(urls, dict):
+            return {key: cls._replace_domain(value, old, new) for key, value in urls.items()}
+        return urls
+
+    @redis_memoize(
+        ttl=3600, key=lambda self, _exchange: f"markets:v2:{settings.exchange}:{settings.market_type}:{'testnet' if settings.sandbox else 'real'}"
+    )
+    async def _load_markets(self, _exchange: ccxt.Exchange) -> Dict[str, Any]:
+        """
+        Carrega mercados e moedas da exchange, compartilhados entre bots via Redis (TTL 1h).
+
+        As moedas acompanham os mercados: num cache hit, set_markets precisa
+        de ambas para deixar a instância igual a um load_markets real.
+        """
+        markets = await _exchange.load_markets()
+        return {"markets": markets, "currencies": _exchange.currencies}
+
     @handle_ccxt_exceptions
-    def _test_connection(self, _exchange: ccxt.Exchange) -> bool:
+    async def _test_connection(self, _exchange: ccxt.Exchange) -> bool:
         """Testa se a conexão com a exchange está funcionando.
 
-        Realiza uma requisição real (fetch_balance) para validar autenticação
-        e conectividade. Trata exceções específicas do CCXT para fornecer
+        Usa fetch_time (peso 1, sem assinatura) para validar conectividade e a
+        diferença de relógio. A autenticação é validada logo em seguida pela
+        primeira chamada assinada (set_leverage). O saldo só é consultado
+        com LOG_BALANCE_ON_START=true. Exchanges sem fetchTime usam
+        fetch_balance. Trata exceções específicas do CCXT para fornecer
         mensagens de erro detalhadas.
 
         Args:
@@ -86,33 +164,73 @@ class ExchangeConn:
             bool: True se a conexão foi bem-sucedida, False caso contrário.
         """
 
-        _balance = _exchange.fetch_balance()
+        _balance = None
+        if _exchange.has.get("fetchTime"):
+            _server_ms = await _exchange.fetch_time()
+            if _server_ms is None:
+                return False
+            _skew_ms = abs(_server_ms - int(time.time() * 1000))
+            if _skew_ms > self.MAX_CLOCK_SKEW_MS:
+                self._log_exchange.warning(f"Relógio local difere do servidor em {_skew_ms} ms.")
+        else:
+            _balance = await _exchange.fetch_balance(self._balance_params())
+
         _mode = "TESTNET" if settings.sandbox else "REAL"
         self._log_exchange.info(
             f"Conexão testada com sucesso! [ {settings.exchange.upper()}, {settings.market_type} | {_mode} ]"
         )
-        self._log_exchange.debug(f"USDT disponível: {_balance['USDT']['free']}")
+        if settings.log_balance_on_start:
+            _balance = _balance or await _exchange.fetch_balance(self._balance_params())
+            self._log_exchange.info("USDT disponível: %s", (_balance.get("USDT") or {}).get("free"))
         return True
 
-    @property
-    def exchange(self) -> ccxt.Exchange:
+    @staticmethod
+    def _balance_params() -> Dict[str, Any]:
+        """
+        Params de fetch_balance que reduzem a resposta.
+
+        omitZeroBalances só é aceito pelo endpoint de conta spot da Binance
+        (/api/v3/account); nos endpoints de futuros seria um parâmetro inválido.
+        """
+        if settings.exchange.startswith("binance") and settings.market_type == "spot":
+            return {"omitZeroBalances": True}
+        return {}
+
+    async def get_exchange(self) -> ccxt.Exchange:
         """Retorna a instância da exchange, criando-a se necessário.
 
-        Implementa padrão de cache: a conexão é criada apenas uma vez
-        e reutilizada em chamadas subsequentes.
+        Implementa padrão singleton por processo: conexão, mercados e teste
+        de conexão acontecem uma única vez, mesmo com vários ExchangeConn.
 
         Returns:
             ccxt.Exchange: Instância autenticada e testada da exchange.
         Raises:
             ConnectionError: Se a conexão não puder ser estabelecida.
         """
-        if self._exchange is None:
-            self._exchange = self._create_ccxt_instance()
-            if not self._test_connection(self._exchange):
-                self._exchange = None
-                raise ConnectionError(
-                    "Falha ao conectar com a exchange - verifique os logs."
-                )
-        else:
-            self._log_exchange.info(f"CACHE OBJECT: {type(self._exchange)}")
-        return self._exchange
+        async with ExchangeConn._shared_lock:
+            if ExchangeConn._shared_exchange is None:
+                _exchange = await self._create_ccxt_instance()
+                if not await self._test_connection(_exchange):
+                    await _exchange.close()
+                    raise ConnectionError(
+                        "Falha ao conectar com a exchange - verifique os logs."
+                    )
+                ExchangeConn._shared_exchange = _exchange
+        return ExchangeConn._shared_exchange
+
+    async def close(self) -> None:
+        """Fecha a instância compartilhada da exchange e a sessão HTTP."""
+        if ExchangeConn._shared_exchange is not None:
+            await ExchangeConn._shared_exchange.close()
+            ExchangeConn._shared_exchange = None
+        await SharedSessionManager.close()
+
+
+async def get_exchange() -> ccxt.Exchange:
+    """Retorna a instância única (por processo) da exchange configurada."""
+    return await ExchangeConn().get_exchange()
+
+
+async def close_exchange() -> None:
+    """Fecha a instância única da exchange e a sessão HTTP compartilhada."""
+    await ExchangeConn().close()
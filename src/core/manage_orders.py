@@ -1,11 +1,65 @@
-import ccxt
-import time
+import asyncio
+import ccxt.async_support as ccxt
 import logging
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, cast
+import math
+import time
+from decimal import Decimal
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Literal, Optional, Set, Tuple, cast
 
-from src.core.settings import settings
+from src.core.settings import Settings, settings
+from src.core.state_feed import StateFeed
 from src.utils.logger import get_logger
-from src.utils.ccxt_decorators import handle_ccxt_exceptions
+from src.utils.ccxt_decorators import handle_ccxt_exceptions, raise_as_runtime_error
+
+_log_order = get_logger("bot.manage_orders")
+
+# Nome da ordem de proteção indexado por is_stop_loss (False -> TP, True -> SL)
+_ORDER_NAMES: Tuple[str, str] = ("Take Profit", "Stop Loss")
+
+# Tipo da ordem de proteção indexado por is_stop_loss (False -> TP, True -> SL)
+_PROTECTION_TYPES: Tuple[str, str] = ("take_profit_market", "stop_market")
+
+# Tipos cujo campo price é o gatilho quando stopPrice não vem preenchido
+_TAKE_PROFIT_TYPES = frozenset({"take_profit", "TAKE_PROFIT"})
+
+# Variantes de params para listar/cancelar ordens condicionais. Cada variante custa
+# uma requisição; exchanges conhecidas usam apenas as que de fato mudam o resultado.
+_OpenOrderVariants = Tuple[Optional[Dict[str, Any]], ...]
+
+_DEFAULT_OPEN_ORDER_VARIANTS: _OpenOrderVariants = (
+    None,
+    {"stop": True},
+    {"type": "STOP"},
+    {"type": "stop"},
+    {"type": "STOP_MARKET"},
+    {"type": "TAKE_PROFIT"},
+    {"type": "TAKE_PROFIT_MARKET"},
+    {"orderType": "STOP"},
+    {"orderType": "TAKE_PROFIT"},
+    {"stop": True, "reduceOnly": True},
+)
+
+_DEFAULT_CANCEL_VARIANTS: _OpenOrderVariants = (
+    None,
+    {"type": "STOP"},
+    {"type": "TAKE_PROFIT"},
+    {"type": "STOP_MARKET"},
+    {"type": "TAKE_PROFIT_MARKET"},
+    {"stop": True},
+    {"orderType": "STOP"},
+    {"orderType": "TAKE_PROFIT"},
+    {"reduceOnly": True, "stop": True},
+)
+
+# Binance Futures: nas versões do CCXT com o endpoint de ordens algo, STOP_MARKET e TAKE_PROFIT_MARKET
+# ficam fora de openOrders e {"stop": True} roteia a consulta/cancelamento para openAlgoOrders.
+# Nas versões sem esse endpoint, openOrders já inclui as condicionais e {"stop": True} repetiria a
+# mesma requisição (dobrando o peso): _resolve_variants mantém apenas a consulta padrão.
+_OPEN_ORDER_VARIANTS_BY_EXCHANGE: Dict[str, _OpenOrderVariants] = {"binance": (None, {"stop": True}), "binanceusdm": (None, {"stop": True})}
+_CANCEL_VARIANTS_BY_EXCHANGE: Dict[str, _OpenOrderVariants] = {"binance": (None, {"stop": True}), "binanceusdm": (None, {"stop": True})}
+
+# Método implícito do CCXT que indica suporte ao endpoint de ordens algo, por exchange
+_ALGO_ORDERS_METHOD_BY_EXCHANGE: Dict[str, str] = {"binance": "fapiPrivateGetOpenAlgoOrders", "binanceusdm": "fapiPrivateGetOpenAlgoOrders"}
 
 
 class ManageOrders:
@@ -24,99 +78,287 @@ class ManageOrders:
     # -------------------------------------------------------------------------
     LONG_SIDE: Literal["buy"] = "buy"
     SHORT_SIDE: Literal["sell"] = "sell"
-    VALID_SIDES: Tuple[Literal["buy"], Literal["sell"]] = ("buy", "sell")
+    VALID_SIDES: FrozenSet[str] = frozenset({"buy", "sell"})
+    PROTECTION_CACHE_TTL: float = 2.0  # Validade da detecção de SL/TP (segundos)
+    TRANSIENT_RETRY_DELAY: float = 0.2  # Espera antes de repetir variantes com falha de rede/rate-limit (segundos)
+    FILL_POLL_INITIAL_DELAY: float = 0.05  # Primeiro intervalo de consulta de execução sem stream (segundos)
+    FILL_POLL_MAX_DELAY: float = 1.0  # Intervalo máximo entre consultas (segundos)
+
+    # Pares (símbolo, alavancagem) já configurados neste processo
+    _LEVERAGE_SET: ClassVar[Set[Tuple[str, int]]] = set()
+
+    __slots__ = (
+        "_log_order",
+        "_exchange",
+        "_state_feed",
+        "_symbol",
+        "_leverage",
+        "_amount",
+        "_percent_sl",
+        "_percent_tp",
+        "_protection_mul",
+        "_entry_mul",
+        "_max_retries",
+        "_max_chase_percent",
+        "_entry_offset_percent",
+        "_entry_fill_timeout",
+        "_price_tick",
+        "_amount_step",
+        "_price_fmt",
+        "_amount_fmt",
+        "_min_amount",
+        "_max_amount",
+        "_min_cost",
+        "_batch_protection",
+        "_protection_cache",
+        "_price_cache",
+        "_price_cache_ttl",
+        "_open_order_variants",
+        "_cancel_variants",
+    )
 
     # -------------------------------------------------------------------------
     # Inicialização
     # -------------------------------------------------------------------------
-    def __init__(self, exchange: ccxt.Exchange) -> None:
+    def __init__(
+        self, exchange: ccxt.Exchange, state_feed: Optional[StateFeed] = None, symbol: Optional[str] = None, pair_settings: Optional[Settings] = None
+    ) -> None:
         """
         Inicializa o gerenciador de ordens.
 
         Args:
-            exchange: Instância CCXT autenticada.
-
-        Raises:
-            ValueError: Se a configuração da alavancagem falhar.
+            exchange: Instância CCXT (async) autenticada, com mercados carregados.
+            state_feed: Estado de ordens, preço e posições via WebSocket (opcional; sem ele usa apenas REST).
+            symbol: Par operado (padrão: symbol das configurações). Permite vários pares no mesmo processo.
+            pair_settings: Configurações do par (padrão: settings global, lido do .env do processo).
         """
-        self._log_order: logging.Logger = get_logger("bot.manage_orders")
+        config = pair_settings or settings
+
+        self._log_order: logging.Logger = _log_order
         self._exchange = exchange
+        self._state_feed = state_feed
 
         # Configurações do par
-        self._symbol = settings.symbol
-        self._leverage = settings.leverage
-        self._amount = settings.amount
+        self._symbol = symbol or config.symbol
+        self._leverage = config.leverage
+        self._amount = config.amount
 
         # Configurações de proteção
-        self._percent_sl = settings.stop_loss_percent
-        self._percent_tp = settings.take_profit_percent
+        self._percent_sl = config.stop_loss_percent
+        self._percent_tp = config.take_profit_percent
+
+        # Multiplicador do preço de entrada por (lado, is_stop_loss)
+        self._protection_mul: Dict[Tuple[str, bool], float] = {
+            (self.LONG_SIDE, True): 1 - self._percent_sl * 0.01,
+            (self.LONG_SIDE, False): 1 + self._percent_tp * 0.01,
+            (self.SHORT_SIDE, True): 1 + self._percent_sl * 0.01,
+            (self.SHORT_SIDE, False): 1 - self._percent_tp * 0.01,
+        }
 
         # Configurações de execução
-        self._max_retries = settings.max_retries
-        self._max_chase_percent = settings.chase_percent
-        self._entry_offset_percent = settings.offset_percent
-        self._entry_fill_timeout = settings.fill_timeout
+        self._max_retries = config.max_retries
+        self._max_chase_percent = config.chase_percent
+        self._entry_offset_percent = config.offset_percent
+        self._entry_fill_timeout = config.fill_timeout
+
+        # Multiplicador do preço atual para a entrada limite, por lado
+        self._entry_mul: Dict[str, float] = {
+            self.LONG_SIDE: 1 - self._entry_offset_percent * 0.01,
+            self.SHORT_SIDE: 1 + self._entry_offset_percent * 0.01,
+        }
+
+        # Variantes de consulta/cancelamento específicas da exchange
+        self._open_order_variants, self._cancel_variants = self._resolve_variants()
+
+        # Precisão do mercado (resolvida uma única vez: o símbolo é fixo)
+        market = self._exchange.market(self._symbol)
+        self._price_tick = self._market_step(market["precision"]["price"]) or self._filter_step(market, "PRICE_FILTER", "tickSize")
+        self._amount_step = self._market_step(market["precision"]["amount"]) or self._filter_step(market, "LOT_SIZE", "stepSize")
+
+        # Formatadores pré-compilados com as casas decimais do passo (ex: "{:.2f}".format)
+        self._price_fmt: Callable[[float], str] = f"{{:.{self._step_digits(self._price_tick)}f}}".format
+        self._amount_fmt: Callable[[float], str] = f"{{:.{self._step_digits(self._amount_step)}f}}".format
+
+        # Limites do mercado para validação local das ordens (None = sem limite informado)
+        limits = market.get("limits") or {}
+        self._min_amount: Optional[float] = (limits.get("amount") or {}).get("min")
+        self._max_amount: Optional[float] = (limits.get("amount") or {}).get("max")
+        self._min_cost: Optional[float] = (limits.get("cost") or {}).get("min")
+
+        # SL/TP em lote (create_orders) apenas fora de mercados lineares: nos contratos USDT-M as ordens
+        # condicionais não são aceitas no batchOrders (NotSupported ou rejeição por entrada)
+        self._batch_protection: bool = bool(self._exchange.has.get("createOrders")) and not market.get("linear")
+
+        # Última detecção de proteção: (timestamp, lado, preço de entrada, has_sl, has_tp)
+        self._protection_cache: Optional[Tuple[float, str, float, bool, bool]] = None
+
+        # Último preço consultado: (timestamp, preço)
+        self._price_cache: Tuple[float, Optional[float]] = (0.0, None)
+        self._price_cache_ttl = config.price_cache_ttl
+
+    def _resolve_variants(self) -> Tuple[_OpenOrderVariants, _OpenOrderVariants]:
+        """
+        Define, uma única vez, as variantes de params usadas para listar e cancelar ordens.
 
-        self._set_leverage()
+        Exchanges conhecidas usam listas mínimas, reduzidas à consulta padrão
+        quando o CCXT instalado não tem o endpoint de ordens algo. Nas demais,
+        as capacidades declaradas em exchange.has eliminam chamadas que
+        falhariam sempre: sem cancelAllOrders o cancelamento vai direto para o
+        individual, e sem suporte a ordens condicionais só a consulta padrão é feita.
 
-    @handle_ccxt_exceptions
-    def _set_leverage(self) -> None:
-        """Configura a alavancagem na exchange."""
-        self._exchange.set_leverage(self._leverage, self._symbol)
-        self._log_order.info(f"Alavancagem configurada: {self._leverage}x")
+        Returns:
+            Tupla com (variantes de fetch_open_orders, variantes de cancel_all_orders).
+        """
+        exchange_id, has = self._exchange.id, self._exchange.has
+
+        open_variants = _OPEN_ORDER_VARIANTS_BY_EXCHANGE.get(exchange_id)
+        if open_variants is None:
+            supports_trigger = has.get("createStopMarketOrder") or has.get("createTriggerOrder") or has.get("createStopOrder")
+            open_variants = _DEFAULT_OPEN_ORDER_VARIANTS if supports_trigger else (None,)
+
+        cancel_variants = _CANCEL_VARIANTS_BY_EXCHANGE.get(exchange_id)
+        if cancel_variants is None:
+            cancel_variants = _DEFAULT_CANCEL_VARIANTS if has.get("cancelAllOrders") else ()
+
+        algo_method = _ALGO_ORDERS_METHOD_BY_EXCHANGE.get(exchange_id)
+        if algo_method is not None and not hasattr(self._exchange, algo_method):
+            # Sem o endpoint algo, {"stop": True} cairia no mesmo openOrders/allOpenOrders
+            open_variants, cancel_variants = (None,), (None,)
+
+        return open_variants, cancel_variants
+
+    async def initialize(self) -> None:
+        """
+        Executa a configuração assíncrona inicial (alavancagem).
+
+        Deve ser chamado uma vez após a construção, antes de operar.
+
+        Raises:
+            RuntimeError: Se a configuração da alavancagem falhar.
+        """
+        await self._set_leverage()
+
+    async def _set_leverage(self) -> None:
+        """Configura a alavancagem na exchange (uma vez por símbolo e alavancagem no processo)."""
+        key = (self._symbol, self._leverage)
+        if key in self._LEVERAGE_SET:
+            return
+
+        try:
+            await self._exchange.set_leverage(self._leverage, self._symbol)
+        except ccxt.BaseError as exc:
+            raise_as_runtime_error("_set_leverage", exc)
+        self._LEVERAGE_SET.add(key)
+        self._log_order.info("Alavancagem configurada: %sx", self._leverage)
 
     # -------------------------------------------------------------------------
     # Métodos de preço e formatação (privados)
     # -------------------------------------------------------------------------
     @handle_ccxt_exceptions
-    def _get_current_price(self) -> Optional[float]:
-        """Recupera o preço de mercado atual."""
-        ticker = self._exchange.fetch_ticker(self._symbol)
+    async def _get_current_price(self) -> Optional[float]:
+        """Recupera o preço de mercado atual (stream de ticker ou REST reaproveitado por price_cache_ttl segundos)."""
+        if self._state_feed is not None and self._state_feed.last_price:
+            return self._state_feed.last_price
+
+        cached_at, cached_price = self._price_cache
+        now = time.monotonic()
+        if cached_price is not None and now - cached_at < self._price_cache_ttl:
+            return cached_price
+
+        ticker = await self._exchange.fetch_ticker(self._symbol)
+        self._price_cache = (now, ticker["last"])
         return ticker["last"]
 
-    @handle_ccxt_exceptions
+    def _market_step(self, precision: Any) -> Optional[float]:
+        """Converte a precisão do mercado CCXT em tamanho de passo (tick/step)."""
+        if precision is None:
+            return None
+        if self._exchange.precisionMode == ccxt.DECIMAL_PLACES:
+            return 10 ** -int(precision)
+        return float(precision)
+
+    @staticmethod
+    def _filter_step(market: Dict[str, Any], filter_type: str, key: str) -> Optional[float]:
+        """Lê o passo dos filtros brutos da Binance (ex: PRICE_FILTER.tickSize) quando a precisão CCXT não vem preenchida."""
+        for market_filter in (market.get("info") or {}).get("filters") or ():
+            if market_filter.get("filterType") == filter_type:
+                try:
+                    return float(market_filter[key]) or None
+                except (KeyError, TypeError, ValueError):
+                    return None
+        return None
+
+    @staticmethod
+    def _step_digits(step: Optional[float]) -> int:
+        """Retorna o número de casas decimais de um passo (ex: 0.001 -> 3)."""
+        if not step:
+            return 0
+        return max(0, -int(Decimal(str(step)).normalize().as_tuple().exponent))
+
+    @staticmethod
+    def _floor_to_step(value: float, step: Optional[float], fmt: Callable[[float], str]) -> float:
+        """Arredonda para baixo até o múltiplo de step, sem passar pelo Decimal do CCXT."""
+        if not step:
+            return float(value)
+        return float(fmt(math.floor(value / step + 1e-9) * step))
+
+    @staticmethod
+    def _round_to_step(value: float, step: Optional[float], fmt: Callable[[float], str]) -> float:
+        """Arredonda para o múltiplo de step mais próximo (meio para cima, como o ROUND do CCXT)."""
+        if not step:
+            return float(value)
+        return float(fmt(math.floor(value / step + 0.5 + 1e-9) * step))
+
+    def _format_price(self, price: float) -> float:
+        """Formata o preço para a precisão da exchange (arredondado; só a quantidade é truncada)."""
+        return self._round_to_step(price, self._price_tick, self._price_fmt)
+
     def _format_amount(self, amount: float) -> float:
         """Formata a quantidade para a precisão da exchange."""
-        precision_amount = self._exchange.amount_to_precision(self._symbol, amount)
-        return float(precision_amount) if precision_amount is not None else float(amount)
+        return self._floor_to_step(amount, self._amount_step, self._amount_fmt)
 
-    def _calculate_entry_price(self, side: str, current_price: float, offset_percent: float) -> float:
-        """Calcula o preço de entrada com offset aplicado."""
+    def _calculate_entry_price(self, side: str, current_price: float) -> float:
+        """Calcula o preço de entrada com o offset configurado (multiplicador pré-computado no __init__)."""
         if current_price <= 0:
             raise ValueError(f"current_price deve ser positivo, recebido: {current_price}")
 
-        offset = offset_percent / 100
-
-        if side == self.LONG_SIDE:
-            price = current_price * (1 - offset)
-        else:
-            price = current_price * (1 + offset)
-
-        precision_price = self._exchange.price_to_precision(self._symbol, price)
-        return float(precision_price) if precision_price is not None else float(price)
+        return self._format_price(current_price * self._entry_mul[side])
 
-    def _calculate_protection_price(self, side: str, entry_price: float, percent: float, is_stop_loss: bool) -> float:
-        """Calcula o preço de Stop Loss ou Take Profit."""
+    def _calculate_protection_price(self, side: str, entry_price: float, is_stop_loss: bool) -> float:
+        """Calcula o preço de Stop Loss ou Take Profit (percentuais pré-computados no __init__)."""
         if entry_price <= 0:
             raise ValueError(f"entry_price deve ser positivo, recebido: {entry_price}")
 
-        is_long = side == self.LONG_SIDE
-        should_subtract = (is_long and is_stop_loss) or (not is_long and not is_stop_loss)
+        return self._format_price(entry_price * self._protection_mul[(side, is_stop_loss)])
 
-        if should_subtract:
-            price = entry_price * (1 - percent / 100)
-        else:
-            price = entry_price * (1 + percent / 100)
+    def _validate_order(self, amount: float, price: Optional[float] = None) -> Optional[str]:
+        """
+        Confere a ordem contra os limites do mercado antes de enviá-la.
+
+        Violações conhecidas localmente não chegam à exchange: evita a
+        requisição e a InvalidOrder tratada pelo decorador.
 
-        precision_price = self._exchange.price_to_precision(self._symbol, price)
-        return float(precision_price) if precision_price is not None else float(price)
+        Args:
+            amount: Quantidade já formatada.
+            price: Preço da ordem (None dispensa o notional mínimo, como em ordens reduceOnly).
+
+        Returns:
+            Motivo da rejeição, ou None se a ordem respeita os limites.
+        """
+        if amount <= 0 or (self._min_amount is not None and amount < self._min_amount):
+            return f"quantidade {amount} abaixo do mínimo ({self._min_amount or self._amount_step})"
+        if self._max_amount is not None and amount > self._max_amount:
+            return f"quantidade {amount} acima do máximo ({self._max_amount})"
+        if price is not None and self._min_cost is not None and amount * price < self._min_cost:
+            return f"notional {amount * price} abaixo do mínimo ({self._min_cost})"
+        return None
 
     # -------------------------------------------------------------------------
     # Extração de dados de posição (privados)
     # -------------------------------------------------------------------------
     def _extract_entry_price(self, position: Dict[str, Any]) -> Optional[float]:
         """Extrai o preço de entrada da posição."""
-        info = position.get("info", {})
+        info = position.get("info") or {}
         raw_price = position.get("entryPrice") or info.get("entryPrice") or info.get("avgEntryPrice")
 
         try:
@@ -127,7 +369,7 @@ class ManageOrders:
 
     def _extract_size(self, position: Dict[str, Any]) -> float:
         """Extrai o tamanho da posição (valor absoluto)."""
-        contracts = position.get("contracts") or position.get("info", {}).get("positionAmt")
+        contracts = position.get("contracts") or (position.get("info") or {}).get("positionAmt")
 
         try:
             return abs(float(contracts or 0))
@@ -136,7 +378,8 @@ class ManageOrders:
 
     def _derive_side(self, position: Dict[str, Any]) -> Optional[str]:
         """Determina o lado da posição (buy/sell)."""
-        side = position.get("side") or position.get("info", {}).get("positionSide")
+        info = position.get("info") or {}
+        side = position.get("side") or info.get("positionSide")
 
         if side:
             side = str(side).lower()
@@ -145,7 +388,7 @@ class ManageOrders:
             if side in ("short", "sell"):
                 return self.SHORT_SIDE
 
-        contracts = position.get("contracts") or position.get("info", {}).get("positionAmt")
+        contracts = position.get("contracts") or info.get("positionAmt")
 
         try:
             value = float(contracts)
@@ -162,93 +405,120 @@ class ManageOrders:
     # Busca de dados na exchange (privados)
     # -------------------------------------------------------------------------
     @handle_ccxt_exceptions
-    def _fetch_positions(self) -> List[Dict[str, Any]]:
-        """Busca todas as posições para o símbolo."""
-        return self._exchange.fetch_positions([self._symbol]) or []
+    async def _fetch_positions(self) -> List[Dict[str, Any]]:
+        """Busca todas as posições para o símbolo (stream de posições, se recente)."""
+        if self._state_feed is not None:
+            positions = self._state_feed.get_positions()
+            if positions is not None:
+                return positions
+
+        positions = await self._exchange.fetch_positions([self._symbol]) or []
+        if self._state_feed is not None:
+            self._state_feed.update_positions(positions)
+        return positions
+
+    async def _run_variants(self, call: Callable[[Dict[str, Any]], Any], variants: _OpenOrderVariants, label: str) -> List[Any]:
+        """
+        Executa call(params) para cada variante concorrentemente.
+
+        Só falhas transitórias (ccxt.NetworkError, que inclui DDoSProtection e
+        RateLimitExceeded) são repetidas, uma vez, após TRANSIENT_RETRY_DELAY.
+        Variantes rejeitadas (BadRequest, NotSupported...) são apenas registradas.
+
+        Returns:
+            Resultado ou exceção de cada variante, na ordem de `variants`.
+        """
+        results = await asyncio.gather(*(call(params or {}) for params in variants), return_exceptions=True)
+
+        transient = [index for index, result in enumerate(results) if isinstance(result, ccxt.NetworkError)]
+        if transient:
+            await asyncio.sleep(self.TRANSIENT_RETRY_DELAY)
+            retried = await asyncio.gather(*(call(variants[index] or {}) for index in transient), return_exceptions=True)
+            for index, result in zip(transient, retried):
+                results[index] = result
+
+        for params, result in zip(variants, results):
+            if isinstance(result, BaseException):
+                self._log_order.debug("%s variant %s ignorado: %s", label, params or "default", result)
+
+        return results
 
     @handle_ccxt_exceptions
-    def _fetch_open_orders(self) -> List[Dict[str, Any]]:
+    async def _fetch_open_orders(self) -> List[Dict[str, Any]]:
         """Busca todas as ordens abertas para o símbolo."""
-        orders: List[Dict[str, Any]] = []
-        seen_ids: Set[str] = set()
-
-        def _collect(result: Optional[List[Dict[str, Any]]]) -> None:
-            if not result:
-                return
-            for order in result:
-                order_id = str(order.get("id")) if order.get("id") is not None else None
-                if order_id and order_id in seen_ids:
-                    continue
-                if order_id:
-                    seen_ids.add(order_id)
-                orders.append(order)
-
-        param_variants: List[Optional[Dict[str, Any]]] = [
-            None,
-            {"stop": True},
-            {"type": "STOP"},
-            {"type": "stop"},
-            {"type": "STOP_MARKET"},
-            {"type": "TAKE_PROFIT"},
-            {"type": "TAKE_PROFIT_MARKET"},
-            {"orderType": "STOP"},
-            {"orderType": "TAKE_PROFIT"},
-            {"stop": True, "reduceOnly": True},
-        ]
-
-        for params in param_variants:
-            try:
-                if params:
-                    response = self._exchange.fetch_open_orders(self._symbol, None, None, params)
+        # Deduplicação por id em uma única estrutura (ordens sem id são mantidas todas)
+        orders_by_id: Dict[str, Dict[str, Any]] = {}
+        orders_without_id: List[Dict[str, Any]] = []
+
+        # Variantes independentes: todas enviadas concorrentemente (1 RTT em vez de N)
+        responses = await self._run_variants(
+            lambda params: self._exchange.fetch_open_orders(self._symbol, None, None, params), self._open_order_variants, "fetch_open_orders"
+        )
+
+        for response in responses:
+            if isinstance(response, BaseException) or not response:
+                continue
+            for order in response:
+                order_id = order.get("id")
+                if order_id is None:
+                    orders_without_id.append(order)
                 else:
-                    response = self._exchange.fetch_open_orders(self._symbol)
-                _collect(response)
-            except Exception as exc:
-                self._log_order.debug(f"fetch_open_orders variant {params or 'default'} ignorado: {exc}")
-                time.sleep(0.2)
+                    orders_by_id.setdefault(str(order_id), order)
 
-        return orders
+        return [*orders_by_id.values(), *orders_without_id]
 
     # -------------------------------------------------------------------------
     # Detecção de ordens de proteção (privados)
     # -------------------------------------------------------------------------
-    def _detect_protection_orders(self, position_side: str, entry_price: float) -> Tuple[bool, bool]:
-        """Detecta ordens de SL e TP existentes para uma posição."""
+    async def _detect_protection_orders(
+        self, position_side: str, entry_price: float, open_orders: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[bool, bool]:
+        """
+        Detecta ordens de SL e TP existentes para uma posição.
+
+        O resultado é reaproveitado por PROTECTION_CACHE_TTL segundos para a
+        mesma posição; qualquer criação ou cancelamento de ordem invalida o cache.
+        Se open_orders não for informado, as ordens abertas são consultadas.
+        """
+        cached = self._protection_cache
+        if cached is not None and cached[1:3] == (position_side, entry_price) and time.monotonic() - cached[0] < self.PROTECTION_CACHE_TTL:
+            return cached[3], cached[4]
+
         has_sl = False
         has_tp = False
-        open_orders = self._fetch_open_orders()
+        if open_orders is None:
+            open_orders = await self._fetch_open_orders()
         closing_side = self.SHORT_SIDE if position_side == self.LONG_SIDE else self.LONG_SIDE
 
-        for order in open_orders:
-            if not self._is_protection_order(order, closing_side):
-                continue
-
+        for order in (o for o in open_orders if self._is_protection_order(o, closing_side)):
             order_type = self._get_order_type(order)
-            stop_price = self._get_stop_price(order)
 
             # Detecta pelo tipo da ordem
             if "take_profit" in order_type:
                 has_tp = True
-                continue
-            if "stop" in order_type and "take_profit" not in order_type:
+            elif "stop" in order_type:
                 has_sl = True
-                continue
-
-            # Detecta pelo preço
-            if stop_price is not None:
-                is_sl, is_tp = self._classify_by_price(position_side, entry_price, stop_price)
-                has_sl = has_sl or is_sl
-                has_tp = has_tp or is_tp
+            else:
+                # Detecta pelo preço
+                stop_price = self._get_stop_price(order)
+                if stop_price is not None:
+                    is_sl, is_tp = self._classify_by_price(position_side, entry_price, stop_price)
+                    has_sl = has_sl or is_sl
+                    has_tp = has_tp or is_tp
+
+            if has_sl and has_tp:
+                break
 
+        self._protection_cache = (time.monotonic(), position_side, entry_price, has_sl, has_tp)
         return has_sl, has_tp
 
     def _is_protection_order(self, order: Dict[str, Any], closing_side: str) -> bool:
         """Verifica se a ordem é uma ordem de proteção válida."""
-        reduce_only = order.get("reduceOnly") or order.get("info", {}).get("reduceOnly")
-        if not reduce_only:
+        info = order.get("info") or {}
+        if not (order.get("reduceOnly") or info.get("reduceOnly")):
             return False
 
-        order_side = (order.get("side") or order.get("info", {}).get("side") or "").lower()
+        order_side = (order.get("side") or info.get("side") or "").lower()
         if order_side and order_side not in self.VALID_SIDES:
             if "sell" in order_side:
                 order_side = self.SHORT_SIDE
@@ -259,16 +529,14 @@ class ManageOrders:
 
     def _get_order_type(self, order: Dict[str, Any]) -> str:
         """Extrai e normaliza o tipo da ordem."""
-        info = order.get("info", {})
-        type_candidates = [order.get("type"), info.get("type"), info.get("origType"), info.get("workingType")]
-        type_candidates = [str(t).lower() for t in type_candidates if t]
-        return " ".join(type_candidates)
+        info = order.get("info") or {}
+        return " ".join(str(t).lower() for t in (order.get("type"), info.get("type"), info.get("origType"), info.get("workingType")) if t)
 
     def _get_stop_price(self, order: Dict[str, Any]) -> Optional[float]:
         """Extrai o preço de stop da ordem."""
-        raw_stop = order.get("stopPrice") or order.get("info", {}).get("stopPrice")
-        if raw_stop is None:
-            raw_stop = order.get("price") if order.get("type") in {"take_profit", "TAKE_PROFIT"} else None
+        raw_stop = order.get("stopPrice") or (order.get("info") or {}).get("stopPrice")
+        if raw_stop is None and order.get("type") in _TAKE_PROFIT_TYPES:
+            raw_stop = order.get("price")
 
         if raw_stop is not None:
             try:
@@ -299,141 +567,325 @@ class ManageOrders:
     # Cancelamento de ordens (privados)
     # -------------------------------------------------------------------------
     @handle_ccxt_exceptions
-    def _cancel_orders_individually(self) -> bool:
-        """Cancela todas as ordens abertas individualmente."""
-        orders = self._fetch_open_orders()
-        success = True
-
-        for order in orders:
-            try:
-                self._exchange.cancel_order(order["id"], self._symbol)
-            except Exception as exc:
-                success = False
-                self._log_order.warning(f"Falha ao cancelar ordem {order.get('id')}: {exc}")
+    async def _cancel_orders_individually(self, orders: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Cancela individualmente as ordens informadas (padrão: todas as ordens abertas)."""
+        self._protection_cache = None
+        if orders is None:
+            orders = await self._fetch_open_orders()
 
         if not orders:
             self._log_order.info("Nenhuma ordem pendente para cancelar.")
+            return True
+
+        success = True
+
+        # Ordens sem id (resposta incompleta da exchange) não podem ser canceladas individualmente
+        without_id = [order for order in orders if not order.get("id")]
+        if without_id:
+            success = False
+            self._log_order.warning("Ordens sem id ignoradas no cancelamento: %s", [order.get("info") for order in without_id])
+            orders = [order for order in orders if order.get("id")]
+
+        results = await asyncio.gather(*(self._exchange.cancel_order(order["id"], self._symbol) for order in orders), return_exceptions=True)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, BaseException):
+                success = False
+                self._log_order.warning("Falha ao cancelar ordem %s: %s", order.get("id"), result)
 
         return success
 
     @handle_ccxt_exceptions
-    def _cancel_all_orders(self) -> None:
+    async def _cancel_all_orders(self) -> None:
         """Cancela todas as ordens abertas usando múltiplas estratégias."""
-        params_to_try: List[Optional[Dict[str, Any]]] = [
-            None,
-            {"type": "STOP"},
-            {"type": "TAKE_PROFIT"},
-            {"type": "STOP_MARKET"},
-            {"type": "TAKE_PROFIT_MARKET"},
-            {"stop": True},
-            {"orderType": "STOP"},
-            {"orderType": "TAKE_PROFIT"},
-            {"reduceOnly": True, "stop": True},
-        ]
-
-        for params in params_to_try:
-            try:
-                if params is None:
-                    self._exchange.cancel_all_orders(self._symbol)
-                else:
-                    self._exchange.cancel_all_orders(self._symbol, params=params)
-                self._log_order.info(f"cancel_all_orders executado: {params or 'default'}")
-            except Exception as exc:
-                self._log_order.debug(f"cancel_all_orders ignorado ({params or 'default'}): {exc}")
-                time.sleep(0.2)
+        self._protection_cache = None
+        params_to_try = self._cancel_variants
+
+        # Variantes independentes: todas enviadas concorrentemente
+        results = await self._run_variants(
+            lambda params: self._exchange.cancel_all_orders(self._symbol, params=params), params_to_try, "cancel_all_orders"
+        )
 
-        self._cancel_orders_individually()
+        for params, result in zip(params_to_try, results):
+            if not isinstance(result, BaseException):
+                self._log_order.info("cancel_all_orders executado: %s", params or "default")
+
+        # Uma única consulta das remanescentes (em geral vazia após o cancelamento em massa)
+        await self._cancel_orders_individually(await self._fetch_open_orders())
 
     # -------------------------------------------------------------------------
     # Criação de ordens (privados)
     # -------------------------------------------------------------------------
-    @handle_ccxt_exceptions
-    def _create_protection_order(
-        self, side: Literal["buy", "sell"], entry_price: float, order_type: str, percent: float, is_stop_loss: bool, amount: float
+    def _build_protection_payload(
+        self, side: Literal["buy", "sell"], entry_price: float, order_type: str, is_stop_loss: bool, amount: float
+    ) -> Dict[str, Any]:
+        """Monta os argumentos de create_order para uma ordem de proteção (amount já formatado)."""
+        protection_price = self._calculate_protection_price(side, entry_price, is_stop_loss)
+        opposite_side = self.SHORT_SIDE if side == self.LONG_SIDE else self.LONG_SIDE
+
+        return {
+            "symbol": self._symbol,
+            "type": order_type,
+            "side": opposite_side,
+            "amount": amount,
+            "params": {"stopPrice": protection_price, "reduceOnly": True},
+        }
+
+    async def _create_protection_order(
+        self, side: Literal["buy", "sell"], entry_price: float, order_type: str, is_stop_loss: bool, amount: float
     ) -> Optional[Dict]:
         """Cria uma ordem de proteção (Stop Loss ou Take Profit)."""
-        protection_price = self._calculate_protection_price(side, entry_price, percent, is_stop_loss)
-        order_name = "Stop Loss" if is_stop_loss else "Take Profit"
-        opposite_side = self.SHORT_SIDE if side == self.LONG_SIDE else self.LONG_SIDE
+        formatted_amount = self._format_amount(amount)
+        if reason := self._validate_order(formatted_amount):
+            self._log_order.warning("Ordem inválida: %s. %s não enviado.", reason, _ORDER_NAMES[is_stop_loss])
+            return None
 
-        order = self._exchange.create_order(
-            symbol=self._symbol,
-            type=cast(Any, order_type),
-            side=opposite_side,
-            amount=self._format_amount(amount),
-            params={"stopPrice": protection_price, "reduceOnly": True},
-        )
-        self._log_order.info(f"{order_name} criado: {protection_price}")
+        payload = self._build_protection_payload(side, entry_price, order_type, is_stop_loss, formatted_amount)
+        self._protection_cache = None
+
+        try:
+            order = await self._exchange.create_order(**payload)
+        except ccxt.BaseError as exc:
+            raise_as_runtime_error("_create_protection_order", exc)
+        self._log_order.info("%s criado: %s", _ORDER_NAMES[is_stop_loss], payload["params"]["stopPrice"])
         return order
 
+    async def _create_protection_orders(
+        self, side: Literal["buy", "sell"], entry_price: float, stop_loss_flags: Tuple[bool, ...] = (True, False)
+    ) -> Dict[bool, Optional[Dict]]:
+        """
+        Cria ordens de proteção individualmente e em paralelo (caminho padrão).
+
+        Args:
+            side: Lado da operação original ('buy' ou 'sell').
+            entry_price: Preço de entrada da posição.
+            stop_loss_flags: Ordens a criar (True = Stop Loss, False = Take Profit).
+
+        Returns:
+            Ordem criada por is_stop_loss (None se falhou). A falha de uma ordem não descarta a outra.
+        """
+        created = await asyncio.gather(
+            *(
+                self._create_protection_order(side, entry_price, _PROTECTION_TYPES[is_stop_loss], is_stop_loss=is_stop_loss, amount=self._amount)
+                for is_stop_loss in stop_loss_flags
+            ),
+            return_exceptions=True,
+        )
+
+        results: Dict[bool, Optional[Dict]] = {}
+        for is_stop_loss, order in zip(stop_loss_flags, created):
+            if isinstance(order, Exception):
+                self._log_order.warning("Falha ao criar %s: %s", _ORDER_NAMES[is_stop_loss], order)
+                order = None
+            results[is_stop_loss] = order
+        return results
+
+    async def _create_protection_batch(self, side: Literal["buy", "sell"], entry_price: float) -> Dict[bool, Optional[Dict]]:
+        """
+        Tenta criar SL e TP numa única requisição (create_orders).
+
+        Otimização sobre _create_protection_orders: ordens rejeitadas, ou o lote
+        inteiro em caso de erro, ficam fora do resultado para serem enviadas
+        individualmente pelo chamador.
+
+        Returns:
+            Ordens criadas pelo lote, por is_stop_loss (apenas as aceitas).
+        """
+        amount = self._format_amount(self._amount)
+        if self._validate_order(amount):
+            return {}  # O caminho individual registra o motivo
+
+        payloads = {
+            is_stop_loss: self._build_protection_payload(side, entry_price, _PROTECTION_TYPES[is_stop_loss], is_stop_loss=is_stop_loss, amount=amount)
+            for is_stop_loss in (True, False)
+        }
+
+        try:
+            orders = await self._exchange.create_orders(list(payloads.values())) or []
+        except (ccxt.NotSupported, ccxt.BadRequest) as exc:
+            # Lote indisponível para estas ordens: não tenta de novo nesta instância
+            self._batch_protection = False
+            self._log_order.warning("Lote de SL/TP não suportado: %s. Enviando individualmente.", exc)
+            return {}
+        except ccxt.BaseError as exc:
+            self._log_order.warning("Lote de SL/TP recusado: %s. Enviando individualmente.", exc)
+            return {}
+
+        results: Dict[bool, Optional[Dict]] = {}
+        for index, (is_stop_loss, payload) in enumerate(payloads.items()):
+            order = orders[index] if index < len(orders) else None
+            if order and order.get("id"):
+                self._log_order.info("%s criado: %s", _ORDER_NAMES[is_stop_loss], payload["params"]["stopPrice"])
+                results[is_stop_loss] = order
+            else:
+                self._log_order.warning("%s rejeitado no lote: %s. Enviando individualmente.", _ORDER_NAMES[is_stop_loss], (order or {}).get("info"))
+        return results
+
+    async def _poll_for_fill(self, order_id: str) -> Optional[Dict]:
+        """
+        Consulta a ordem via REST com intervalos crescentes até ser executada ou o fill_timeout expirar.
+
+        Usado quando não há stream de ordens: detecta a execução logo após ela
+        ocorrer, sem esperar o timeout inteiro.
+
+        Returns:
+            Última versão consultada da ordem, ou None se nenhuma consulta foi feita.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._entry_fill_timeout
+        delay = self.FILL_POLL_INITIAL_DELAY
+        refreshed: Optional[Dict] = None
+
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(delay, remaining))
+            refreshed = await self._exchange.fetch_order(order_id, self._symbol)
+            if float(refreshed.get("filled") or 0) > 0:
+                break
+            delay = min(delay * 2, self.FILL_POLL_MAX_DELAY)
+
+        return refreshed
+
     @handle_ccxt_exceptions
-    def _send_order(self, side: Literal["buy", "sell"], amount: float) -> Optional[Dict]:
+    async def _send_order(self, side: Literal["buy", "sell"], amount: float) -> Optional[Dict]:
         """Envia ordem de entrada com retry e limite de perseguição de preço."""
         max_retries = self._max_retries if self._max_retries > 0 else 1
 
-        initial_price = self._get_current_price()
+        formatted_amount = self._format_amount(amount)
+        if reason := self._validate_order(formatted_amount):
+            self._log_order.error("Ordem inválida: %s. Abortando ordem.", reason)
+            return None
+
+        initial_price = await self._get_current_price()
         if not initial_price or initial_price <= 0:
             self._log_order.error("Preço inicial inválido ou zero. Abortando ordem.")
             return None
 
         best_attempt: Optional[Dict] = None
+        pending: Optional[Dict] = None  # Ordem aberta e não executada da tentativa anterior
+        can_edit = bool(self._exchange.has.get("editOrder"))
+
+        # Invariantes do loop (formatted_amount já resolvido acima)
+        exchange, symbol = self._exchange, self._symbol
+        chase_limit = initial_price * self._max_chase_percent * 0.01  # Desvio máximo em unidades de preço
+        state_feed = self._state_feed if self._state_feed is not None and self._state_feed.is_supported else None
+        calculate_entry_price, validate = self._calculate_entry_price, self._validate_order
 
         for attempt in range(1, max_retries + 1):
-            current_price = self._get_current_price()
+            # Primeira tentativa usa o preço inicial (desvio zero); as seguintes consultam de novo
+            current_price = initial_price if attempt == 1 else await self._get_current_price()
             if not current_price or current_price <= 0:
                 self._log_order.warning("Preço atual inválido. Abortando tentativa.")
                 break
 
-            price_deviation = abs((current_price - initial_price) / initial_price) * 100
+            price_move = abs(current_price - initial_price)
 
-            if price_deviation > self._max_chase_percent:
-                self._log_order.warning(f"Preço se moveu {price_deviation:.3f}% desde o início. Abortando.")
+            if price_move > chase_limit:
+                self._log_order.warning("Preço se moveu %.3f%% desde o início. Abortando.", price_move / initial_price * 100)
                 break
 
-            entry_price = self._calculate_entry_price(side, current_price, self._entry_offset_percent)
+            entry_price = calculate_entry_price(side, current_price)
+            if reason := validate(formatted_amount, entry_price):
+                self._log_order.warning("Ordem inválida: %s. Abortando.", reason)
+                break
 
-            order = self._exchange.create_order(symbol=self._symbol, type="limit", side=side, amount=self._format_amount(amount), price=entry_price)
+            # Perseguição: reprecifica a ordem pendente em 1 RTT (cancel + create custaria 2)
+            order: Optional[Dict] = None
+            if pending is not None:
+                try:
+                    order = await exchange.edit_order(pending["id"], symbol, "limit", side, formatted_amount, entry_price)
+                except ccxt.BaseError as exc:
+                    self._log_order.warning("Falha ao reprecificar a ordem %s: %s", pending["id"], exc)
+                if not order or "id" not in order:
+                    # A ordem antiga pode ter executado ou seguir aberta: resolve antes de enviar outra
+                    if filled := await self._settle_pending(pending):
+                        return filled
+                    order = None
+                pending = None
+            if order is None:
+                order = await exchange.create_order(symbol=symbol, type="limit", side=side, amount=formatted_amount, price=entry_price)
 
             if not order or "id" not in order:
                 continue
 
             best_attempt = order
-            time.sleep(self._entry_fill_timeout)
 
-            refreshed = self._exchange.fetch_order(order["id"], self._symbol)
+            # Com o stream de ordens, retorna assim que a execução chega (sem esperar o timeout inteiro)
+            if state_feed is not None:
+                refreshed = await state_feed.wait_for_fill(order["id"], self._entry_fill_timeout)
+            else:
+                refreshed = await self._poll_for_fill(order["id"])
+            # REST apenas se o stream ainda não entregou nenhuma versão da ordem
+            if not refreshed:
+                refreshed = await exchange.fetch_order(order["id"], symbol)
             filled_qty = float(refreshed.get("filled") or 0)
 
             if filled_qty > 0:
                 return refreshed
 
-            self._log_order.info(f"Ordem {order['id']} não executada. Cancelando e tentando novamente...")
-            self._exchange.cancel_order(order["id"], self._symbol)
+            if can_edit and attempt < max_retries:
+                self._log_order.info("Ordem %s não executada. Reprecificando...", order["id"])
+                pending = order
+                continue
+
+            self._log_order.info("Ordem %s não executada. Cancelando e tentando novamente...", order["id"])
+            await exchange.cancel_order(order["id"], symbol)
+            pending = None
+
+        # Tentativas interrompidas com uma ordem ainda aberta
+        if pending is not None:
+            await exchange.cancel_order(pending["id"], symbol)
 
         return best_attempt
 
-    def _recreate_missing_protection(self, side: str, entry_price: float, has_sl: bool, has_tp: bool) -> None:
+    async def _settle_pending(self, pending: Dict) -> Optional[Dict]:
+        """
+        Resolve uma ordem de entrada cuja reprecificação (edit_order) falhou.
+
+        Consulta o estado real da ordem: se ainda está aberta, é cancelada para
+        que a próxima tentativa não duplique a posição; se executou (mesmo que
+        parcialmente) no intervalo, é retornada para seguir para a proteção.
+
+        Returns:
+            A ordem com execução, ou None se não executou e não está mais aberta.
+        """
+        order = await self._exchange.fetch_order(pending["id"], self._symbol)
+        if order.get("status") == "open":
+            try:
+                order = await self._exchange.cancel_order(pending["id"], self._symbol) or order
+            except ccxt.OrderNotFound:
+                # Executada entre a consulta e o cancelamento
+                order = await self._exchange.fetch_order(pending["id"], self._symbol)
+
+        return order if float(order.get("filled") or 0) > 0 else None
+
+    async def _recreate_missing_protection(self, side: str, entry_price: float, has_sl: bool, has_tp: bool) -> None:
         """Recria ordens de proteção faltantes."""
         typed_side = cast(Literal["buy", "sell"], side)
 
         if not has_sl:
-            sl_order = self._create_protection_order(typed_side, entry_price, "stop_market", self._percent_sl, is_stop_loss=True, amount=self._amount)
+            sl_order = await self._create_protection_order(typed_side, entry_price, "stop_market", is_stop_loss=True, amount=self._amount)
             if not sl_order:
                 self._log_order.warning("Falha ao recriar Stop Loss.")
 
         if not has_tp:
-            tp_order = self._create_protection_order(
-                typed_side, entry_price, "take_profit_market", self._percent_tp, is_stop_loss=False, amount=self._amount
-            )
+            tp_order = await self._create_protection_order(typed_side, entry_price, "take_profit_market", is_stop_loss=False, amount=self._amount)
             if not tp_order:
                 self._log_order.warning("Falha ao recriar Take Profit.")
 
     # -------------------------------------------------------------------------
     # Interface pública
     # -------------------------------------------------------------------------
-    def send_protection_orders(self, side: Literal["buy", "sell"], entry_price: float) -> Tuple[Optional[Dict], Optional[Dict]]:
+    @handle_ccxt_exceptions
+    async def send_protection_orders(self, side: Literal["buy", "sell"], entry_price: float) -> Tuple[Optional[Dict], Optional[Dict]]:
         """
         Cria ordens de Stop Loss e Take Profit para uma posição.
 
+        O caminho padrão cria cada ordem individualmente (em paralelo). Quando o
+        lote (create_orders) aceita ordens condicionais no mercado (não linear),
+        ele é tentado antes como otimização; qualquer ordem que o lote não criar
+        é enviada pelo caminho individual, para que a posição nunca fique sem
+        proteção por causa do lote.
+
         Args:
             side: Lado da operação original ('buy' ou 'sell').
             entry_price: Preço de entrada da posição.
@@ -441,11 +893,19 @@ class ManageOrders:
         Returns:
             Tupla com (ordem_sl, ordem_tp), onde cada elemento pode ser None se falhar.
         """
-        sl_order = self._create_protection_order(side, entry_price, "stop_market", self._percent_sl, is_stop_loss=True, amount=self._amount)
-        tp_order = self._create_protection_order(side, entry_price, "take_profit_market", self._percent_tp, is_stop_loss=False, amount=self._amount)
-        return sl_order, tp_order
+        self._protection_cache = None
 
-    def open_order(self, side: Literal["buy", "sell"]) -> Dict:
+        results: Dict[bool, Optional[Dict]] = {}
+        if self._batch_protection:
+            results = await self._create_protection_batch(side, entry_price)
+
+        missing = tuple(is_stop_loss for is_stop_loss in (True, False) if not results.get(is_stop_loss))
+        if missing:
+            results.update(await self._create_protection_orders(side, entry_price, missing))
+
+        return results[True], results[False]
+
+    async def open_order(self, side: Literal["buy", "sell"]) -> Dict:
         """
         Abre uma posição com ordem de entrada e ordens de proteção.
 
@@ -459,12 +919,12 @@ class ManageOrders:
             ValueError: Se o parâmetro side for inválido.
         """
         if side not in self.VALID_SIDES:
-            self._log_order.error(f"Side deve ser '{self.LONG_SIDE}' ou '{self.SHORT_SIDE}': {side}")
+            self._log_order.error("Side deve ser '%s' ou '%s': %s", self.LONG_SIDE, self.SHORT_SIDE, side)
             raise ValueError(f"Side inválido: {side}")
 
         result = {"success": False, "order": None, "entry_price": None, "sl_order": None, "tp_order": None}
 
-        order_result = self._send_order(side, self._amount)
+        order_result = await self._send_order(side, self._amount)
         if not order_result or not order_result.get("id"):
             self._log_order.warning("Falha ao criar a ordem principal.")
             return result
@@ -478,28 +938,28 @@ class ManageOrders:
         is_filled = filled_qty > 0 or status in {"closed", "filled"}
 
         if not is_filled:
-            self._log_order.warning(f"Ordem criada mas não preenchida. [Id: {order_result.get('id')}] [Status: {status}]")
+            self._log_order.warning("Ordem criada mas não preenchida. [Id: %s] [Status: %s]", order_result.get("id"), status)
             return result
 
-        self._log_order.info(f"Ordem preenchida! [Lado: {side}] [Preço: {entry_price}] [Id: {order_result['id']}]")
+        self._log_order.info("Ordem preenchida! [Lado: %s] [Preço: %s] [Id: %s]", side, entry_price, order_result["id"])
 
         if filled_qty > 0:
             self._amount = filled_qty
 
         if entry_price is None:
-            entry_price = self._get_current_price()
+            entry_price = await self._get_current_price()
             result["entry_price"] = entry_price
 
         if entry_price is None:
             self._log_order.warning("Preço de entrada indisponível. Não é possível criar SL/TP.")
             return result
 
-        sl_order, tp_order = self.send_protection_orders(side, float(entry_price))
+        sl_order, tp_order = await self.send_protection_orders(side, float(entry_price))
         result.update({"success": True, "entry_price": float(entry_price), "sl_order": sl_order, "tp_order": tp_order})
 
         return result
 
-    def normalize_position_state(self) -> Optional[bool]:
+    async def normalize_position_state(self) -> Optional[bool]:
         """
         Verifica e normaliza o estado da posição.
 
@@ -508,8 +968,16 @@ class ManageOrders:
             False se não há posição.
             None se houve erro ao verificar.
         """
+        # Posições e ordens abertas são independentes: consultadas em paralelo,
+        # exceto quando a detecção de proteção ainda está em cache
+        cached = self._protection_cache
+        prefetch_orders = cached is None or time.monotonic() - cached[0] >= self.PROTECTION_CACHE_TTL
+
         try:
-            positions = self._fetch_positions()
+            if prefetch_orders:
+                positions, open_orders = await asyncio.gather(self._fetch_positions(), self._fetch_open_orders())
+            else:
+                positions, open_orders = await self._fetch_positions(), None
         except RuntimeError:
             self._log_order.error("Não foi possível verificar posição. Mantendo estado atual por segurança.")
             return None
@@ -517,8 +985,8 @@ class ManageOrders:
         active_position = next((p for p in positions if self._extract_size(p) > 0), None)
 
         if not active_position:
-            self._log_order.info(f"Nenhuma posição ativa em {self._symbol}. Cancelando ordens pendentes.")
-            self._cancel_all_orders()
+            self._log_order.info("Nenhuma posição ativa em %s. Cancelando ordens pendentes.", self._symbol)
+            await self._cancel_all_orders()
             return False
 
         entry_price = self._extract_entry_price(active_position)
@@ -526,20 +994,20 @@ class ManageOrders:
 
         if entry_price is None or side is None:
             self._log_order.warning("Posição sem dados suficientes. Cancelando ordens por segurança.")
-            self._cancel_all_orders()
+            await self._cancel_all_orders()
             return False
 
         position_size = self._extract_size(active_position)
         if position_size > 0:
             self._amount = position_size
 
-        has_sl, has_tp = self._detect_protection_orders(side, entry_price)
+        has_sl, has_tp = await self._detect_protection_orders(side, entry_price, open_orders)
 
         if has_sl and has_tp:
-            self._log_order.info(f"Posição ativa em {self._symbol}. SL/TP configurados. ✓")
+            self._log_order.info("Posição ativa em %s. SL/TP configurados. ✓", self._symbol)
             return True
 
-        self._log_order.warning(f"Ordens de proteção incompletas (SL: {has_sl}, TP: {has_tp}). Recriando...")
-        self._recreate_missing_protection(side, entry_price, has_sl, has_tp)
+        self._log_order.warning("Ordens de proteção incompletas (SL: %s, TP: %s). Recriando...", has_sl, has_tp)
+        await self._recreate_missing_protection(side, entry_price, has_sl, has_tp)
 
         return True
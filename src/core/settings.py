@@ -7,12 +7,19 @@ Usa Pydantic Settings para:
 - Fornecer valores padrão
 """
 
-from pydantic import field_validator
+import functools
+from typing import Annotated, Any, cast
+
+from dotenv import dotenv_values
+from pydantic import NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt, StringConstraints, ValidationError, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from src.utils.logger import get_logger
 
 _log_settings = get_logger("bot.settings")
 
+# String obrigatória: sem espaços nas pontas e não vazia (validada pelo pydantic-core)
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
 
 class Settings(BaseSettings):
     """Configurações do bot carregadas do ambiente."""
@@ -26,21 +33,28 @@ class Settings(BaseSettings):
     # =========================================================================
     # EXCHANGE (carregados do .env)
     # =========================================================================
-    exchange: str = ""  # Nome da exchange:  binance, bybit, etc.
-    market_type: str = "future"  # "future' ou "spot"
+    exchange: NonEmptyStr = ""  # Nome da exchange:  binance, bybit, etc.
+    market_type: NonEmptyStr = "future"  # "future' ou "spot"
     sandbox: bool = True  # Modo teste (SEMPRE começa em True!)
     """. env tem SANDBOX?  
     ├── SIM → usa o valor do .env
     └── NÃO → usa o default do settings.py (True)
     """
 
+    # Latência: a maior parte do tempo de cada requisição é o RTT até a exchange.
+    # Rodar o bot na mesma região da exchange (Binance: AWS ap-northeast-1, Tóquio)
+    # costuma valer mais que qualquer otimização de código. EXCHANGE_HOSTNAME troca
+    # o domínio base das URLs da API (ex: bybit.com -> bytick.com; na binance,
+    # binance.com -> outro domínio oficial). Ignorado no modo sandbox.
+    exchange_hostname: str = ""  # Domínio base alternativo da API (vazio = padrão do CCXT)
+
     # Chaves Testnet
-    binance_api_key_test: str = ""
-    binance_api_secret_test: str = ""
+    binance_api_key_test: NonEmptyStr = ""
+    binance_api_secret_test: NonEmptyStr = ""
 
     # Chaves Reais
-    binance_api_key: str = ""
-    binance_api_secret: str = ""
+    binance_api_key: NonEmptyStr = ""
+    binance_api_secret: NonEmptyStr = ""
 
     @property
     def api_key(self) -> str:
@@ -65,90 +79,99 @@ class Settings(BaseSettings):
     # =========================================================================
     # PAIR TRADING
     # =========================================================================
-    symbol: str = ""  # Par de moedas:  BTCUSDT, SOLUSDT, etc.
-    timeframe: str = ""  # Timeframe:  1m, 5m, 15m, 1h, 4h, 1d
-    leverage: int  # Alavancagem
-    amount: float  # Quantidade a operar
-    stop_loss_percent: float  # Stop Loss em %
-    take_profit_percent: float  # Take Profit em %
-    chase_percent: float
-    offset_percent: float
-    fill_timeout: int = 30
-    max_retries: int = 3  # Tentativas em caso de erro
+    symbol: NonEmptyStr = ""  # Par de moedas:  BTCUSDT, SOLUSDT, etc.
+    timeframe: NonEmptyStr = ""  # Timeframe:  1m, 5m, 15m, 1h, 4h, 1d
+    leverage: PositiveInt  # Alavancagem
+    amount: PositiveFloat  # Quantidade a operar
+    stop_loss_percent: PositiveFloat  # Stop Loss em %
+    take_profit_percent: PositiveFloat  # Take Profit em %
+    chase_percent: PositiveFloat
+    offset_percent: PositiveFloat
+    fill_timeout: PositiveInt = 30
+    max_retries: PositiveInt = 3  # Tentativas em caso de erro
+    price_cache_ttl: NonNegativeFloat = 0.15  # Reuso do último ticker REST em segundos (0 = sempre consulta)
 
     # =========================================================================
     # SISTEMA (com defaults)
     # =========================================================================
     timezone: str = "America/Sao_Paulo"
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+    redis_url: str = ""  # Cache compartilhado entre bots (vazio = desativado)
+    log_balance_on_start: bool = False  # Consulta e registra o saldo USDT na inicialização (+1 requisição assinada)
 
     # =========================================================================
     # EXECUTION SCHEDULE
     # =========================================================================
-    market_open_day: int
-    market_open_hour: int
-    market_open_minute: int
+    market_open_day: PositiveInt
+    market_open_hour: PositiveInt
+    market_open_minute: NonNegativeInt
 
-    market_close_day: int
-    market_close_hour: int
-    market_close_minute: int
+    market_close_day: PositiveInt
+    market_close_hour: PositiveInt
+    market_close_minute: NonNegativeInt
 
     # =========================================================================
-    # VALIDAÇÕES: Não negativos
+    # VALIDAÇÕES
     # =========================================================================
-    @field_validator("market_open_minute", "market_close_minute")
+    # Positivos, não negativos e strings não vazias são restrições dos tipos
+    # acima (executadas no pydantic-core); aqui apenas registramos as falhas.
+    @model_validator(mode="wrap")
     @classmethod
-    def validate_non_negative(cls, v: int, info) -> int:
-        """Garante que minutos sejam >= 0."""
-        if v < 0:
-            _log_settings.error(f"{info.field_name} não pode ser negativo")
-            raise ValueError
-        return v
-
-    # =========================================================================
-    # VALIDAÇÕES: Int, Float
-    # =========================================================================
-    @field_validator(
-        "leverage",
-        "amount",
-        "stop_loss_percent",
-        "take_profit_percent",
-        "chase_percent",
-        "offset_percent",
-        "fill_timeout",
-        "max_retries",
-        "market_open_day",
-        "market_open_hour",
-        "market_close_day",
-        "market_close_hour",
-    )
-    @classmethod
-    def validate_positive(cls, v: int | float, info) -> int | float:
-        """Garante que valores numéricos críticos sejam positivos."""
-        if v <= 0:
-            _log_settings.error(f"{info.field_name} deve ser maior que 0")
-            raise ValueError
-        return v
-
-    # =========================================================================
-    # VALIDAÇÕES: Strings
-    # =========================================================================
-    @field_validator(
-        "exchange", "market_type", "binance_api_key_test", "binance_api_secret_test", "binance_api_key", "binance_api_secret", "symbol", "timeframe"
-    )
-    @classmethod
-    def not_empty(cls, v: str, info) -> str:
-        """Garante que campos críticos não sejam strings vazias."""
-        if not v or not v.strip():
-            _log_settings.error(f"{info.field_name} não pode ser vazio")
-            raise ValueError
-        return v.strip()
+    def log_validation_errors(cls, data: Any, handler: Any) -> "Settings":
+        """Registra no log cada campo inválido antes de propagar o erro."""
+        try:
+            return handler(data)
+        except ValidationError as exc:
+            for error in exc.errors():
+                field_name = ".".join(str(part) for part in error["loc"]) or "settings"
+                _log_settings.error("%s: %s", field_name, error["msg"])
+            raise
 
 
 # =========================================================================
-# INSTÂNCIA GLOBAL (Singleton)
+# INSTÂNCIA GLOBAL (Singleton, criada no primeiro uso)
 # =========================================================================
-settings = Settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Cria (na primeira chamada) e retorna a instância única de Settings."""
+    return Settings()
+
+
+class _LazySettings:
+    """
+    Proxy do singleton: o .env só é lido e validado no primeiro acesso a um atributo.
+
+    Importar src.core (ferramentas, notebooks) não exige mais um .env válido.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+
+settings = cast(Settings, _LazySettings())
+
+
+def load_pair_settings(env_file: str) -> Settings:
+    """
+    Cria as configurações de um par a partir do seu arquivo .env.
+
+    Com vários pares no mesmo processo, o ambiente do processo não identifica
+    um par: os valores do arquivo são passados explicitamente e têm prioridade
+    sobre ele. Campos ausentes no arquivo (chaves, exchange, horários) seguem a
+    ordem normal: ambiente, .env e default. Chaves do arquivo que não são campos
+    de Settings são ignoradas (como no carregamento via env_file), em vez de
+    serem rejeitadas como extra_forbidden.
+
+    Args:
+        env_file: Caminho do .env do par (ex: config/btc.env).
+
+    Returns:
+        Settings do par.
+    """
+    values = {key.lower(): value for key, value in dotenv_values(env_file).items() if value is not None and key.lower() in Settings.model_fields}
+    return Settings(**values)
 
 
 """
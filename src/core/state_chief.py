@@ -1,11 +1,12 @@
-import time
-from enum import Enum
-from typing import Literal, Optional
-from src.core.settings import settings
+import asyncio
+import random
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, Literal, Optional
+from src.core.settings import Settings, settings
 from src.core.manage_orders import ManageOrders
-from src.utils.market_hours import MarketHoursChecker
+from src.utils.market_hours import MarketHoursChecker, MarketStatus
 
-import ccxt
+import ccxt.async_support as ccxt
 
 from src.utils.logger import get_logger
 
@@ -17,29 +18,39 @@ class StateChief:
     Gerencia o ciclo completo: inicialização, análise, abertura e monitoramento.
     """
 
-    class BotState(Enum):
-        INITIALIZING = "initializing"
-        ANALYZING = "analyzing"
-        OPENING_POSITION = "opening_position"
-        MONITORING = "monitoring"
-        STANDBY = "standby"
-        ERROR = "error"
-
-    def __init__(self, exchange: ccxt.Exchange, manage_orders: ManageOrders, hours_checker: MarketHoursChecker) -> None:
+    class BotState(IntEnum):
+        INITIALIZING = 0
+        ANALYZING = 1
+        OPENING_POSITION = 2
+        MONITORING = 3
+        STANDBY = 4
+        ERROR = 5
+
+    def __init__(
+        self,
+        exchange: ccxt.Exchange,
+        manage_orders: ManageOrders,
+        hours_checker: MarketHoursChecker,
+        symbol: Optional[str] = None,
+        pair_settings: Optional[Settings] = None,
+    ) -> None:
         """
         Inicializa o controlador de estados.
 
         Args:
-            exchange: Instância CCXT autenticada.
+            exchange: Instância CCXT (async) autenticada.
             manage_orders: Intância ManageOrders
             hours_checker: Intância MarketHoursChecker
+            symbol: Par operado (padrão: symbol das configurações)
+            pair_settings: Configurações do par (padrão: settings global)
 
         """
+        config = pair_settings or settings
         self._log_state_chief = get_logger("bot.state_chief")
 
         # Dependências principais
-        self._symbol = settings.symbol
-        self._timeframe = settings.timeframe
+        self._symbol = symbol or config.symbol
+        self._timeframe = config.timeframe
         self._exchange = exchange
         self._manage_orders = manage_orders
         self._hours_checker = hours_checker
@@ -48,63 +59,59 @@ class StateChief:
         self._state = StateChief.BotState.INITIALIZING
         self._side: Optional[Literal["buy", "sell"]] = None
         self._retry_count: int = 0
-        self._max_retries: int = settings.max_retries
+        self._max_retries: int = config.max_retries
 
         self._wait_sleep: int = 60  # Intervalo padrão (segundos)
         self._next_window: int = 0
         self._monitoring_sleep: int = 300  # MONITORING: 5 minutos
-
-        self._log_state_chief.info("StateChief inicializado. Estado: INITIALIZING")
+        self._error_backoff_base: int = 5  # ERROR: espera base, dobrada a cada tentativa (segundos)
+        self._error_backoff_cap: int = 300  # ERROR: espera máxima antes do jitter (segundos)
+        self._error_backoff_jitter: float = 5.0  # ERROR: jitter aleatório somado à espera (segundos)
+
+        # Handler de cada estado (consulta O(1) no loop principal)
+        self._dispatch: Dict[StateChief.BotState, Callable[[], Awaitable[None]]] = {
+            StateChief.BotState.INITIALIZING: self._handle_initializing,
+            StateChief.BotState.ANALYZING: self._handle_analyzing,
+            StateChief.BotState.OPENING_POSITION: self._handle_opening_position,
+            StateChief.BotState.MONITORING: self._handle_monitoring,
+            StateChief.BotState.ERROR: self._handle_error,
+            StateChief.BotState.STANDBY: self._handle_standby,
+        }
+
+        self._log_state_chief.info("StateChief inicializado para %s. Estado: INITIALIZING", self._symbol)
 
     # =========================================================================
     # LOOP PRINCIPAL
     # =========================================================================
-    def run(self) -> None:
+    async def run(self) -> None:
         """Loop principal da máquina de estados."""
         while self._state is not None:
             try:
-                self._log_state_chief.info(f"[Estado: {self._state.value}]")
-
-                if self._state == StateChief.BotState.INITIALIZING:
-                    self._handle_initializing()
-
-                elif self._state == StateChief.BotState.ANALYZING:
-                    self._handle_analyzing()
-
-                elif self._state == StateChief.BotState.OPENING_POSITION:
-                    self._handle_opening_position()
+                self._log_state_chief.info("[Estado: %s]", self._state.name)
+                await self._dispatch[self._state]()
 
-                elif self._state == StateChief.BotState.MONITORING:
-                    self._handle_monitoring()
-
-                elif self._state == StateChief.BotState.ERROR:
-                    self._handle_error()
-
-                elif self._state == StateChief.BotState.STANDBY:
-                    self._handle_standby()
-
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
                 self._log_state_chief.info("Bot interrompido manualmente. Encerrando...")
                 break
 
             except Exception as e:
-                self._log_state_chief.critical(f"Erro inesperado no loop principal: {e}", exc_info=True)
+                self._log_state_chief.critical("Erro inesperado no loop principal: %s", e, exc_info=True)
                 self._state = StateChief.BotState.ERROR
 
     # =========================================================================
     # HANDLERS DE ESTADO
     # =========================================================================
-    def _handle_initializing(self) -> None:
+    async def _handle_initializing(self) -> None:
         """Inicializa ManageOrders e normaliza posição."""
         try:
-            # Verifica janela operacional
-            is_market_open = self._hours_checker.is_market_open()
-            if not is_market_open:
+            # Verifica janela operacional (o tempo até a abertura já segue para o STANDBY)
+            status, self._next_window = self._hours_checker.evaluate()
+            if status is not MarketStatus.OPEN:
                 self._state = StateChief.BotState.STANDBY
                 return
 
             # Normaliza posição existente
-            is_trading = self._manage_orders.normalize_position_state()
+            is_trading = await self._manage_orders.normalize_position_state()
 
             # None = erro ao verificar, vai pro ERROR
             if is_trading is None:
@@ -123,21 +130,21 @@ class StateChief:
             self._retry_count = 0
 
         except Exception as e:
-            self._log_state_chief.critical(f"Erro ao inicializar: {e}", exc_info=True)
+            self._log_state_chief.critical("Erro ao inicializar: %s", e, exc_info=True)
             self._retry_count += 1
             self._state = StateChief.BotState.ERROR
 
-    def _handle_analyzing(self) -> None:
+    async def _handle_analyzing(self) -> None:
         """Executa análise de mercado e identifica sinais."""
         try:
-            self._log_state_chief.info(f"Analisando {self._symbol} ({self._timeframe})...")
+            self._log_state_chief.info("Analisando %s (%s)...", self._symbol, self._timeframe)
 
             # 1. Atualiza dados
             df = self._dataset_manager.update()
 
             if df.empty:
                 self._log_state_chief.warning("DataFrame vazio. Aguardando próximo ciclo.")
-                time.sleep(self._wait_sleep)
+                await asyncio.sleep(self._wait_sleep)
                 return
 
             # 2. Aplica indicadores
@@ -151,11 +158,11 @@ class StateChief:
 
             if "signal" not in df.columns:
                 self._log_state_chief.warning("Coluna 'signal' ausente. Aguardando próximo ciclo.")
-                time.sleep(self._wait_sleep)
+                await asyncio.sleep(self._wait_sleep)
                 return
 
             # 5. Lê sinal mais recente
-            latest_signal = int(df["signal"].iloc[-1])
+            latest_signal = int(df["signal"].iat[-1])
 
             if latest_signal == 1:
                 self._side = "buy"
@@ -169,16 +176,16 @@ class StateChief:
 
             else:
                 self._log_state_chief.info("Nenhum sinal detectado. Aguardando próximo candle.")
-                time.sleep(self._wait_sleep)
+                await asyncio.sleep(self._wait_sleep)
 
             self._retry_count = 0
 
         except Exception as e:
-            self._log_state_chief.error(f"Erro durante análise: {e}", exc_info=True)
+            self._log_state_chief.error("Erro durante análise: %s", e, exc_info=True)
             self._retry_count += 1
             self._state = StateChief.BotState.ERROR
 
-    def _handle_opening_position(self) -> None:
+    async def _handle_opening_position(self) -> None:
         """Abre uma nova posição com base no sinal."""
         try:
             if not self._side:
@@ -191,14 +198,14 @@ class StateChief:
                 self._state = StateChief.BotState.ERROR
                 return
 
-            self._log_state_chief.info(f"Tentando abrir posição: {self._side.upper()} para {self._symbol}")
+            self._log_state_chief.info("Tentando abrir posição: %s para %s", self._side.upper(), self._symbol)
 
             # Abre ordem
-            result = self._manage_orders.open_order(self._side)
+            result = await self._manage_orders.open_order(self._side)
 
             if result and result.get("success"):
                 entry_price = result.get("entry_price")
-                self._log_state_chief.info(f"Posição aberta! Preço: {entry_price}")
+                self._log_state_chief.info("Posição aberta! Preço: %s", entry_price)
                 self._state = StateChief.BotState.MONITORING
             else:
                 self._log_state_chief.warning("Falha ao abrir posição. Voltando para ANALYZING.")
@@ -208,26 +215,26 @@ class StateChief:
             self._retry_count = 0
 
         except Exception as e:
-            self._log_state_chief.critical(f"Erro ao abrir posição: {e}", exc_info=True)
+            self._log_state_chief.critical("Erro ao abrir posição: %s", e, exc_info=True)
             self._retry_count += 1
             self._state = StateChief.BotState.ERROR
 
-    def _handle_monitoring(self) -> None:
+    async def _handle_monitoring(self) -> None:
         """Monitora posição ativa."""
         try:
-            self._log_state_chief.info(f"Monitorando posição em {self._symbol}...")
+            self._log_state_chief.info("Monitorando posição em %s...", self._symbol)
 
             if self._manage_orders is None:
                 self._log_state_chief.error("ManageOrders não inicializado.")
                 self._state = StateChief.BotState.ERROR
                 return
 
-            is_trading = self._manage_orders.normalize_position_state()
+            is_trading = await self._manage_orders.normalize_position_state()
 
             # None = erro ao verificar, mantém MONITORING e tenta novamente
             if is_trading is None:
                 self._log_state_chief.warning("Erro ao verificar posição. Mantendo MONITORING por segurança.")
-                time.sleep(self._monitoring_sleep)
+                await asyncio.sleep(self._monitoring_sleep)
                 return
 
             if not is_trading:
@@ -235,47 +242,52 @@ class StateChief:
                 self._state = StateChief.BotState.ANALYZING
             else:
                 self._log_state_chief.info("Ordens de proteção confirmadas.")
-                time.sleep(self._monitoring_sleep)
+                await asyncio.sleep(self._monitoring_sleep)
 
         except Exception as e:
-            self._log_state_chief.critical(f"Erro no monitoramento: {e}", exc_info=True)
+            self._log_state_chief.critical("Erro no monitoramento: %s", e, exc_info=True)
             self._retry_count += 1
             self._state = StateChief.BotState.ERROR
 
-    def _handle_error(self) -> None:
+    async def _handle_error(self) -> None:
         """Tenta recuperar após falhas."""
-        self._log_state_chief.warning(f"Estado ERROR. Tentativa {self._retry_count}/{self._max_retries}")
+        self._log_state_chief.warning("Estado ERROR. Tentativa %s/%s", self._retry_count, self._max_retries)
 
         try:
-            time.sleep(20)
-
             if self._retry_count >= self._max_retries:
                 self._log_state_chief.critical("Limite de tentativas atingido. Encerrando robô.")
                 self._state = None  # Encerra o loop
                 return
 
+            # Backoff exponencial com jitter: erros transitórios se recuperam rápido,
+            # falhas persistentes (ex: rate limit) esperam progressivamente mais
+            backoff = min(self._error_backoff_cap, self._error_backoff_base * 2**self._retry_count)
+            await asyncio.sleep(backoff + random.uniform(0, self._error_backoff_jitter))
+
             self._log_state_chief.info("Tentando reinicialização...")
             self._state = StateChief.BotState.INITIALIZING
 
         except Exception as e:
-            self._log_state_chief.critical(f"Erro na recuperação: {e}", exc_info=True)
+            self._log_state_chief.critical("Erro na recuperação: %s", e, exc_info=True)
             self._retry_count += 1
 
-    def _handle_standby(self):
+    async def _handle_standby(self) -> None:
         """Aguarda a próxima janela operacional abrir"""
         self._log_state_chief.info("Horário fora da janela operacional.")
-        self._next_window = self._hours_checker.seconds_until_next_open()
+        if not self._next_window:
+            self._next_window = self._hours_checker.seconds_until_next_open()
 
         # Contagem regressiva com horas e minutos
         remaining_seconds = self._next_window
         while remaining_seconds > 0:
             hours, remainder = divmod(remaining_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
-            self._log_state_chief.info(f"Próxima janela em: {int(hours):02d}h {int(minutes):02d}m {int(seconds):02d}s")
+            self._log_state_chief.info("Próxima janela em: %02dh %02dm %02ds", int(hours), int(minutes), int(seconds))
             # Intervalo de atualização: 60s ou o tempo restante (o que for menor)
             sleep_interval = min(60 * 60, remaining_seconds)
-            time.sleep(sleep_interval)
+            await asyncio.sleep(sleep_interval)
             remaining_seconds -= sleep_interval
 
+        self._next_window = 0
         self._log_state_chief.info("Janela operacional aberta. Voltando para INITIALIZING.")
         self._state = StateChief.BotState.INITIALIZING
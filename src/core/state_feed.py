@@ -0,0 +1,256 @@
+"""
+Estado da conta em memória alimentado por WebSocket (CCXT Pro).
+
+Mantém assinaturas de longa duração (watch_orders, watch_ticker,
+watch_positions) e guarda a última versão de ordens, preço e posições do
+símbolo, para que ManageOrders consulte o estado sem uma requisição REST
+por verificação.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+import ccxt.async_support as ccxt
+
+from src.core.settings import settings
+from src.utils.logger import get_logger
+
+
+class StateFeed:
+    """
+    Consome streams WebSocket da exchange e mantém o estado em memória.
+
+    A mesma instância de exchange (singleton do processo) é compartilhada com
+    o resto do bot, então os mercados são carregados uma única vez. Cada
+    stream só é iniciado se a exchange o suportar; enquanto um stream não
+    entregou dados, os métodos de leitura retornam None e o chamador usa REST.
+
+    Uso:
+        feed = StateFeed(exchange)
+        feed.start()
+        order = await feed.wait_for_fill(order_id, timeout=5)
+        ...
+        await feed.stop()
+    """
+
+    RECONNECT_DELAY: float = 5.0  # Espera após erro no stream (segundos)
+    POSITIONS_MAX_AGE: float = 60.0  # Idade máxima do snapshot de posições antes de exigir REST (segundos)
+    TICKER_MAX_AGE: float = 5.0  # Idade máxima do último preço do stream antes de exigir REST (segundos)
+    MAX_TRACKED_ORDERS: int = 500  # Ordens mantidas em memória (as mais antigas são descartadas)
+    FINAL_STATUSES = frozenset({"closed", "canceled", "cancelled", "expired", "rejected"})
+
+    def __init__(self, exchange: ccxt.Exchange, symbol: Optional[str] = None) -> None:
+        """
+        Inicializa o feed (sem abrir conexões).
+
+        Args:
+            exchange: Instância CCXT Pro autenticada.
+            symbol: Par acompanhado (padrão: settings.symbol).
+        """
+        self._log_feed: logging.Logger = get_logger("bot.state_feed")
+        self._exchange = exchange
+        self._symbol = symbol or settings.symbol
+        self._market_symbol: Optional[str] = None  # Símbolo unificado do mercado (ex: BTC/USDT:USDT), resolvido sob demanda
+
+        self._orders: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._order_events: Dict[str, asyncio.Event] = {}
+        self._last_price: Optional[float] = None
+        self._last_price_at: float = 0.0
+        self._positions: Optional[List[Dict[str, Any]]] = None
+        self._positions_at: float = 0.0
+        self._tasks: List[asyncio.Task] = []
+
+    # -------------------------------------------------------------------------
+    # Ciclo de vida
+    # -------------------------------------------------------------------------
+    @property
+    def is_supported(self) -> bool:
+        """True se a exchange oferece watch_orders."""
+        return bool(self._exchange.has.get("watchOrders"))
+
+    def start(self) -> None:
+        """Inicia as tarefas de stream suportadas em segundo plano (idempotente)."""
+        if self._tasks:
+            return
+
+        streams: Dict[str, Callable[[], Coroutine[Any, Any, None]]] = {
+            "watchOrders": self._orders_loop,
+            "watchTicker": self._ticker_loop,
+            "watchPositions": self._positions_loop,
+        }
+
+        for capability, loop in streams.items():
+            if self._exchange.has.get(capability):
+                self._tasks.append(asyncio.create_task(loop()))
+            else:
+                self._log_feed.warning("%s não suporta %s. Usando REST.", self._exchange.id, capability)
+
+        if self._tasks:
+            self._log_feed.info("%s stream(s) iniciado(s) para %s.", len(self._tasks), self._symbol)
+
+    async def stop(self) -> None:
+        """Cancela as tarefas de stream e aguarda o encerramento."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    # -------------------------------------------------------------------------
+    # Leitura do estado
+    # -------------------------------------------------------------------------
+    @property
+    def last_price(self) -> Optional[float]:
+        """Último preço recebido pelo stream de ticker, ou None se ausente ou mais antigo que TICKER_MAX_AGE."""
+        if self._last_price is None or time.monotonic() - self._last_price_at > self.TICKER_MAX_AGE:
+            return None
+        return self._last_price
+
+    def get_positions(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Posições do símbolo em memória.
+
+        A Binance só envia posições quando elas mudam; um snapshot mais antigo
+        que POSITIONS_MAX_AGE retorna None para que o chamador confirme via REST
+        (e realimente o feed com update_positions).
+
+        Returns:
+            Lista de posições do símbolo, ou None se não houver snapshot recente.
+        """
+        if self._positions is None or time.monotonic() - self._positions_at > self.POSITIONS_MAX_AGE:
+            return None
+        return self._positions
+
+    def update_positions(self, positions: List[Dict[str, Any]]) -> None:
+        """Registra um snapshot de posições obtido via REST."""
+        market_symbol = self._resolve_market_symbol()
+        self._positions = [p for p in positions if p.get("symbol") in (market_symbol, self._symbol)]
+        self._positions_at = time.monotonic()
+
+    def _resolve_market_symbol(self) -> str:
+        """
+        Símbolo unificado do mercado operado.
+
+        Em futuros, SYMBOL=BTC/USDT resolve para BTC/USDT:USDT, que é o símbolo
+        presente nas posições retornadas pela exchange.
+        """
+        if self._market_symbol is None:
+            try:
+                self._market_symbol = self._exchange.market(self._symbol)["symbol"]
+            except Exception:
+                return self._symbol  # Mercados ainda não carregados: tenta de novo na próxima chamada
+        return self._market_symbol
+
+    async def wait_for_fill(self, order_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Aguarda a ordem ser executada (total ou parcialmente) ou encerrada.
+
+        Retorna assim que o stream entregar a execução, sem esperar o timeout
+        inteiro. Sem o stream de ordens, apenas aguarda o timeout.
+
+        Args:
+            order_id: Id da ordem.
+            timeout: Espera máxima em segundos.
+
+        Returns:
+            Última versão conhecida da ordem, ou None se nenhuma atualização chegou.
+            Uma ordem em estado final é entregue uma única vez e sai da memória.
+        """
+        order_id = str(order_id)
+        event = self._order_events.setdefault(order_id, asyncio.Event())
+        if self._is_settled(self._orders.get(order_id)):
+            event.set()
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._order_events.pop(order_id, None)
+
+        order = self._orders.get(order_id)
+        if order is not None and str(order.get("status") or "").lower() in self.FINAL_STATUSES:
+            del self._orders[order_id]
+        return order
+
+    def _is_settled(self, order: Optional[Dict[str, Any]]) -> bool:
+        """True se a ordem já tem execução ou está em estado final."""
+        if not order:
+            return False
+        return bool(float(order.get("filled") or 0)) or str(order.get("status") or "").lower() in self.FINAL_STATUSES
+
+    # -------------------------------------------------------------------------
+    # Streams
+    # -------------------------------------------------------------------------
+    async def _run_stream(self, name: str, receive: Callable[[], Coroutine[Any, Any, None]], reset: Optional[Callable[[], None]] = None) -> None:
+        """
+        Executa um stream indefinidamente, reconectando após erros.
+
+        Args:
+            name: Nome do stream (para log).
+            receive: Corrotina que recebe e processa uma atualização.
+            reset: Descarta o estado do stream em caso de erro (evita dados obsoletos).
+        """
+        while True:
+            try:
+                await receive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if reset is not None:
+                    reset()
+                self._log_feed.warning("Stream de %s interrompido: %s. Reconectando em %ss...", name, exc, self.RECONNECT_DELAY)
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _orders_loop(self) -> None:
+        """Recebe atualizações de ordens, guarda a versão mais recente por id e sinaliza execuções."""
+
+        async def receive() -> None:
+            orders = await self._exchange.watch_orders(self._symbol)
+            for order in orders:
+                if order.get("id") is None:
+                    continue
+                order_id = str(order["id"])
+                self._orders[order_id] = order
+                self._orders.move_to_end(order_id)
+                event = self._order_events.get(order_id)
+                if event is not None and self._is_settled(order):
+                    event.set()
+
+            # Ordens que ninguém aguardou (ex: SL/TP) não acumulam indefinidamente
+            while len(self._orders) > self.MAX_TRACKED_ORDERS:
+                self._orders.popitem(last=False)
+
+        def reset() -> None:
+            # Após reconexão, atualizações perdidas tornariam as versões guardadas obsoletas
+            self._orders.clear()
+
+        await self._run_stream("ordens", receive, reset)
+
+    async def _ticker_loop(self) -> None:
+        """Recebe o ticker do símbolo e guarda o último preço."""
+
+        async def receive() -> None:
+            ticker = await self._exchange.watch_ticker(self._symbol)
+            if ticker.get("last"):
+                self._last_price = float(ticker["last"])
+                self._last_price_at = time.monotonic()
+
+        def reset() -> None:
+            self._last_price = None
+
+        await self._run_stream("ticker", receive, reset)
+
+    async def _positions_loop(self) -> None:
+        """Recebe as posições do símbolo e guarda o snapshot mais recente."""
+
+        async def receive() -> None:
+            positions = await self._exchange.watch_positions([self._symbol])
+            self.update_positions(positions)
+
+        def reset() -> None:
+            self._positions = None
+
+        await self._run_stream("posições", receive, reset)
@@ -0,0 +1,117 @@
+"""
+Rate limiter assíncrono baseado no peso de requisição da Binance.
+
+Substitui o limitador padrão do CCXT (espaçamento fixo por chamada) por dois
+baldes que seguem as cotas reais da Binance Futures:
+- peso de requisição: 2400 por minuto;
+- ordens: 300 a cada 10 segundos.
+O saldo do balde de peso é recalibrado pelo header X-MBX-USED-WEIGHT-1M.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Dict, Optional
+
+# Endpoints (POST) que contam para a cota de ordens
+ORDER_PATHS = frozenset({"order", "batchOrders"})
+
+
+class LeakyBucket:
+    """Balde de tokens assíncrono com reabastecimento contínuo."""
+
+    def __init__(self, capacity: float, refill_per_s: float) -> None:
+        """
+        Args:
+            capacity: Quantidade máxima de tokens.
+            refill_per_s: Tokens devolvidos ao balde por segundo.
+        """
+        self.capacity = capacity
+        self.refill_per_s = refill_per_s
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Devolve ao balde os tokens acumulados desde a última atualização."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_s)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Consome `tokens`, aguardando apenas o tempo necessário para reabastecer."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.refill_per_s)
+                self._refill()
+            self._tokens -= tokens
+
+    def sync_used(self, used: float) -> None:
+        """Alinha o saldo com o consumo informado pela exchange."""
+        self._refill()
+        self._tokens = min(self._tokens, self.capacity - used)
+
+
+class BinanceRateLimiter:
+    """Par de baldes (peso e ordens) com as cotas da Binance Futures."""
+
+    WEIGHT_CAPACITY: int = 2400  # Peso por minuto
+    WEIGHT_REFILL_PER_S: float = 40.0
+    ORDER_CAPACITY: int = 300  # Ordens por janela
+    ORDER_WINDOW_S: float = 10.0
+
+    def __init__(self) -> None:
+        self.weight_bucket = LeakyBucket(self.WEIGHT_CAPACITY, self.WEIGHT_REFILL_PER_S)
+        self.order_bucket = LeakyBucket(self.ORDER_CAPACITY, self.ORDER_CAPACITY / self.ORDER_WINDOW_S)
+
+    async def acquire(self, weight: float, is_order: bool) -> None:
+        """Aguarda cota de peso (e de ordens, se for uma ordem) antes da requisição."""
+        await self.weight_bucket.acquire(weight)
+        if is_order:
+            await self.order_bucket.acquire(1)
+
+    def update_from_headers(self, headers: Optional[Dict[str, Any]]) -> None:
+        """Recalibra o balde de peso a partir de X-MBX-USED-WEIGHT-1M."""
+        if not headers:
+            return
+        for name, value in headers.items():
+            if name.lower() == "x-mbx-used-weight-1m":
+                try:
+                    self.weight_bucket.sync_used(float(value))
+                except (TypeError, ValueError):
+                    pass
+                return
+
+
+@functools.cache
+def with_weight_limiter(exchange_class: type) -> type:
+    """
+    Cria uma subclasse da exchange CCXT que aplica o BinanceRateLimiter.
+
+    Toda requisição REST passa por fetch2; o custo usado é o peso que o
+    próprio CCXT calcula para o endpoint. Usar com "enableRateLimit": False.
+
+    Args:
+        exchange_class: Classe CCXT da Binance (ex: ccxt.pro.binance).
+
+    Returns:
+        Subclasse com o mesmo nome e o limitador por peso.
+    """
+
+    class WeightLimitedExchange(exchange_class):
+        def __init__(self, config: Dict[str, Any] = {}) -> None:
+            super().__init__(config)
+            self._weight_limiter = BinanceRateLimiter()
+
+        async def fetch2(self, path, api="public", method="GET", params={}, headers=None, body=None, config={}):
+            weight = self.calculate_rate_limiter_cost(api, method, path, params, config)
+            await self._weight_limiter.acquire(weight, is_order=method == "POST" and path in ORDER_PATHS)
+            try:
+                return await super().fetch2(path, api, method, params, headers, body, config)
+            finally:
+                self._weight_limiter.update_from_headers(self.last_response_headers)
+
+    WeightLimitedExchange.__name__ = exchange_class.__name__
+    WeightLimitedExchange.__qualname__ = exchange_class.__qualname__
+    return WeightLimitedExchange
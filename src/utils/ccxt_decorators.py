@@ -1,8 +1,41 @@
 import functools
+import inspect
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, NoReturn
 import ccxt
 
+_log_ccxt = logging.getLogger("bot.ccxt_decorator")
+
+# Rótulo por classe de exceção, da mais específica para a mais genérica
+# (a primeira correspondência por isinstance vence)
+_EXCEPTION_LABELS = (
+    (ccxt.NetworkError, "Erro de rede"),
+    (ccxt.PermissionDenied, "Permissão negada"),
+    (ccxt.AuthenticationError, "Erro de autenticação"),
+    (ccxt.InvalidOrder, "Ordem inválida"),
+    (ccxt.ExchangeError, "Erro da exchange"),
+    (ccxt.BaseError, "Erro CCXT"),
+)
+
+
+def raise_as_runtime_error(method_name: str, exc: Exception) -> NoReturn:
+    """
+    Registra a exceção capturada e relança como RuntimeError descritivo.
+
+    Usada pelo decorador e, diretamente, em blocos try/except estreitos ao
+    redor da chamada CCXT (sem o custo do wrapper nos métodos quentes).
+
+    Args:
+        method_name: Nome do método decorado (usado no log).
+        exc: Exceção original.
+
+    Raises:
+        RuntimeError: Sempre, encadeado à exceção original.
+    """
+    label = next((label for exc_class, label in _EXCEPTION_LABELS if isinstance(exc, exc_class)), "Erro inesperado")
+    _log_ccxt.error("%s ao executar %s: %s", label, method_name, exc)
+    raise RuntimeError(f"{label}: {exc}") from exc
+
 
 def handle_ccxt_exceptions(method: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -12,6 +45,8 @@ def handle_ccxt_exceptions(method: Callable[..., Any]) -> Callable[..., Any]:
     e relança como RuntimeError com mensagens descritivas. Usa o logger
     'bot.ccxt_decorator' configurado em logger.py.
 
+    Suporta métodos síncronos e corrotinas (ccxt.async_support).
+
     Args:
         method: Método a ser decorado.
 
@@ -23,36 +58,27 @@ def handle_ccxt_exceptions(method: Callable[..., Any]) -> Callable[..., Any]:
 
     Exemplo:
         @handle_ccxt_exceptions
-        def _send_order(self, side: str) -> dict:
-            return self._exchange.create_order(...)
+        async def _send_order(self, side: str) -> dict:
+            return await self._exchange.create_order(...)
     """
+    method_name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception as exc:
+                raise_as_runtime_error(method_name, exc)
+
+        return async_wrapper
 
     @functools.wraps(method)
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-        logger = logging.getLogger("bot.ccxt_decorator")
-
         try:
             return method(self, *args, **kwargs)
-        except ccxt.NetworkError as exc:
-            logger.error(f"Erro de rede ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Erro de rede: {exc}") from exc  # L38
-        except ccxt.PermissionDenied as exc:
-            logger.error(f"Permissão negada ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Permissão negada: {exc}") from exc  # L41
-        except ccxt.AuthenticationError as exc:
-            logger.error(f"Erro de autenticação ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Erro de autenticação: {exc}") from exc  # L44
-        except ccxt.InvalidOrder as exc:
-            logger.error(f"Ordem inválida ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Ordem inválida: {exc}") from exc  # L47
-        except ccxt.ExchangeError as exc:
-            logger.error(f"Erro da exchange ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Erro da exchange: {exc}") from exc  # L50
-        except ccxt.BaseError as exc:
-            logger.error(f"Erro CCXT ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Erro CCXT: {exc}") from exc  # L53
         except Exception as exc:
-            logger.error(f"Erro inesperado ao executar {method.__name__}: {exc}")
-            raise RuntimeError(f"Erro inesperado: {exc}") from exc  # L56
+            raise_as_runtime_error(method_name, exc)
 
     return wrapper
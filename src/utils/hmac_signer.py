@@ -0,0 +1,49 @@
+"""
+Assinatura HMAC com chave pré-processada para clientes CCXT.
+
+O CCXT chama hmac.new(secret, ...) a cada requisição assinada, refazendo o
+padding da chave (ipad/opad) toda vez. Aqui o objeto HMAC da chave é criado
+uma única vez e apenas copiado por requisição.
+"""
+
+import functools
+import hashlib
+import hmac
+from typing import Any, Callable, Dict
+
+
+@functools.cache
+def with_cached_hmac(exchange_class: type) -> type:
+    """
+    Cria uma subclasse da exchange CCXT que reutiliza o estado HMAC da chave.
+
+    Só o caminho usado pela Binance (SHA-256, digest hex) é especializado;
+    qualquer outra combinação delega ao CCXT.
+
+    Args:
+        exchange_class: Classe CCXT (ex: ccxt.async_support.binance).
+
+    Returns:
+        Subclasse com o mesmo nome e comportamento, exceto o custo de assinatura
+        (criada uma única vez por classe de exchange).
+    """
+
+    class CachedHmacExchange(exchange_class):
+        _hmac_templates: Dict[bytes, Any] = {}
+
+        def hmac(self, request: bytes, secret: bytes, algorithm: Callable[..., Any] = hashlib.sha256, digest: str = "hex") -> Any:
+            if algorithm is not hashlib.sha256 or digest != "hex":
+                return super().hmac(request, secret, algorithm, digest)
+
+            template = self._hmac_templates.get(secret)
+            if template is None:
+                template = hmac.new(secret, digestmod=hashlib.sha256)
+                self._hmac_templates[secret] = template
+
+            signer = template.copy()
+            signer.update(request)
+            return signer.hexdigest()
+
+    CachedHmacExchange.__name__ = exchange_class.__name__
+    CachedHmacExchange.__qualname__ = exchange_class.__qualname__
+    return CachedHmacExchange
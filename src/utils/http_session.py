@@ -0,0 +1,59 @@
+"""
+Sessão HTTP compartilhada pelo processo.
+
+Mantém um único aiohttp.ClientSession (pool keep-alive) injetado na
+instância CCXT, evitando um novo handshake TCP+TLS a cada requisição.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+
+class SharedSessionManager:
+    """
+    Gerencia o ciclo de vida de um aiohttp.ClientSession único por processo.
+
+    Uso:
+        session = SharedSessionManager.get_session()
+        exchange = ccxt.binance({"session": session})
+        ...
+        await SharedSessionManager.close()
+    """
+
+    # -------------------------------------------------------------------------
+    # Configuração do pool de conexões
+    # -------------------------------------------------------------------------
+    CONNECTOR_LIMIT: int = 2000  # Conexões simultâneas no total
+    CONNECTOR_LIMIT_PER_HOST: int = 100  # Conexões simultâneas por host
+    DNS_CACHE_TTL: int = 300  # Cache de DNS em segundos
+    KEEPALIVE_TIMEOUT: float = 75.0  # Conexão ociosa mantida aberta (padrão do aiohttp: 15s)
+
+    _session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Retorna a sessão compartilhada, criando-a se necessário.
+
+        Deve ser chamado de dentro de um event loop em execução.
+
+        Returns:
+            aiohttp.ClientSession: Sessão com pool de conexões keep-alive.
+        """
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=cls.CONNECTOR_LIMIT,
+                limit_per_host=cls.CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=cls.DNS_CACHE_TTL,
+                keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+            )
+            cls._session = aiohttp.ClientSession(connector=connector)
+        return cls._session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Fecha a sessão compartilhada e libera as conexões do pool."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
@@ -1,3 +1,4 @@
+import atexit
 import logging
 from logging.config import dictConfig
 from pathlib import Path
@@ -34,16 +35,50 @@ MODULES = {
     "exchange_conn": {"level": "DEBUG", "color": "bright_magenta"},
     "manage_orders": {"level": "DEBUG", "color": "bright_green"},
     "state_chief": {"level": "DEBUG", "color": "bright_yellow"},
+    "redis_memo": {"level": "INFO", "color": "bright_blue"},
+    "state_feed": {"level": "DEBUG", "color": "bright_white"},
+    "run_all": {"level": "INFO", "color": "bright_red"},
 }
 
+
+# =============================================================================
+# FORMATTER DO CONSOLE COMPARTILHADO
+# =============================================================================
+class ModuleConsoleFormatter(logging.Formatter):
+    """Prefixa a mensagem com o nome do módulo na cor definida em MODULES."""
+
+    def __init__(self) -> None:
+        super().__init__("%(message)s")
+        self._prefixes = {f"bot.{module}": f"[{props['color']}][{module.upper()}][/{props['color']}] " for module, props in MODULES.items()}
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self._prefixes.get(record.name, "") + super().format(record)
+
+
 # =============================================================================
 # CONFIGURAÇÃO BASE DO LOGGING
 # =============================================================================
 LOGGING_CONFIG: dict[str, Any] = {
     "version": 1,
     "disable_existing_loggers": False,
-    "formatters": {"file": {"format": "%(asctime)s|%(name)s|%(levelname)s|%(message)s"}},
-    "handlers": {},  # Será preenchido dinamicamente no loop abaixo
+    "formatters": {"file": {"format": "%(asctime)s|%(name)s|%(levelname)s|%(message)s"}, "console": {"()": ModuleConsoleFormatter}},
+    # Console único para todos os módulos (a cor vem do ModuleConsoleFormatter);
+    # handlers de arquivo são preenchidos dinamicamente no loop abaixo
+    "filters": {},
+    "handlers": {
+        "console": {
+            "()": "rich.logging.RichHandler",
+            "formatter": "console",
+            "rich_tracebacks": False,
+            "tracebacks_show_locals": False,
+            "show_time": True,
+            "show_level": True,
+            "omit_repeated_times": False,
+            "enable_link_path": False,
+            "show_path": False,
+            "markup": True,
+        }
+    },
     "loggers": {},
 }
 
@@ -51,41 +86,36 @@ LOGGING_CONFIG: dict[str, Any] = {
 # CONFIGURAÇÃO AUTOMÁTICA DOS MÓDULOS
 # =============================================================================
 for module, props in MODULES.items():
-    color = props["color"]
     level = props["level"]
 
     # Arquivo de log específico para o módulo
     module_log_file = LOG_DIR / f"{module}.log"
 
-    # Formatter console com cor específica
-    LOGGING_CONFIG["formatters"][f"console_{module}"] = {"format": f"[{color}][{module.upper()}][/{color}] %(message)s"}
+    # Filtro que restringe o arquivo aos registros do próprio módulo
+    LOGGING_CONFIG["filters"][f"only_{module}"] = {"name": f"bot.{module}"}
 
     # Handler de arquivo específico para o módulo
     LOGGING_CONFIG["handlers"][f"file_{module}"] = {
         "class": "logging.handlers.RotatingFileHandler",
         "formatter": "file",
+        "filters": [f"only_{module}"],
         "filename": str(module_log_file),
         "maxBytes": 5 * 1024 * 1024,  # 5MB
         "backupCount": 5,
         "encoding": "utf-8",
     }
 
-    # Handler de console específico
-    LOGGING_CONFIG["handlers"][f"console_{module}"] = {
-        "()": "rich.logging.RichHandler",
-        "formatter": f"console_{module}",
-        "rich_tracebacks": False,
-        "tracebacks_show_locals": False,
-        "show_time": True,
-        "show_level": True,
-        "omit_repeated_times": False,
-        "enable_link_path": False,
-        "show_path": False,
-        "markup": True,
-    }
+    # Logger do módulo usa:  fila única (console compartilhado + arquivo próprio)
+    LOGGING_CONFIG["loggers"][f"bot.{module}"] = {"handlers": ["queue"], "level": level, "propagate": False}
 
-    # Logger do módulo usa:  console próprio + arquivo próprio
-    LOGGING_CONFIG["loggers"][f"bot.{module}"] = {"handlers": [f"console_{module}", f"file_{module}"], "level": level, "propagate": False}
+# Fila única: os loggers só enfileiram; console e arquivos são escritos pela
+# thread do QueueListener, fora do event loop. Cada arquivo aceita apenas os
+# registros do seu módulo (filtro only_<módulo>)
+LOGGING_CONFIG["handlers"]["queue"] = {
+    "class": "logging.handlers.QueueHandler",
+    "handlers": ["console", *(f"file_{module}" for module in MODULES)],
+    "respect_handler_level": True,
+}
 
 # =============================================================================
 # CONFIGURAÇÃO DE BIBLIOTECAS EXTERNAS
@@ -101,6 +131,12 @@ for module, props in MODULES.items():
 # =============================================================================
 dictConfig(LOGGING_CONFIG)
 
+# Inicia o listener da fila (o dictConfig apenas o cria) e garante que os
+# registros pendentes sejam gravados ao encerrar o processo
+_listener = logging.getHandlerByName("queue").listener
+_listener.start()
+atexit.register(_listener.stop)
+
 
 # =============================================================================
 # FUNÇÃO AUXILIAR
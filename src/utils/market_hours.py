@@ -6,7 +6,8 @@ configurações de horário definidas no . env
 """
 
 from datetime import datetime, time, timedelta
-from src.core.settings import settings
+from typing import Optional, Tuple
+from src.core.settings import Settings, settings
 from zoneinfo import ZoneInfo
 from enum import Enum
 
@@ -41,24 +42,32 @@ class MarketHoursChecker:
             # entrar em standby
     """
 
-    def __init__(self):
-        self.tz = ZoneInfo(settings.timezone)
-        self.open_day = settings.market_open_day
-        self.open_hour = settings.market_open_hour
-        self.open_minute = settings.market_open_minute
-        self.close_day = settings.market_close_day
-        self.close_hour = settings.market_close_hour
-        self.close_minute = settings.market_close_minute
+    def __init__(self, pair_settings: Optional[Settings] = None):
+        config = pair_settings or settings
+        self.tz = ZoneInfo(config.timezone)
+        self.open_day = config.market_open_day
+        self.open_hour = config.market_open_hour
+        self.open_minute = config.market_open_minute
+        self.close_day = config.market_close_day
+        self.close_hour = config.market_close_hour
+        self.close_minute = config.market_close_minute
 
-    def get_status(self) -> MarketStatus:
+        # Próxima abertura calculada (válida até ser alcançada)
+        self._cached_next_open: Optional[datetime] = None
+
+    def get_status(self, now: Optional[datetime] = None) -> MarketStatus:
         """
         Verifica se o mercado está aberto ou em standby.
 
+        Args:
+            now: Horário atual no fuso do mercado (padrão: datetime.now(self.tz))
+
         Retorna:
             MarketStatus. OPEN - Mercado aberto, pode operar
             MarketStatus. STANDBY - Mercado fechado, aguardar
         """
-        now = datetime.now(self.tz)
+        if now is None:
+            now = datetime.now(self.tz)
         weekday = now.weekday()
         current_time = now.time()
 
@@ -83,24 +92,57 @@ class MarketHoursChecker:
         # Segunda a Quinta = sempre aberto
         return MarketStatus.OPEN
 
-    def is_market_open(self) -> bool:
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
         """Retorna True se o mercado está aberto."""
-        return self.get_status() == MarketStatus.OPEN
+        return self.get_status(now) == MarketStatus.OPEN
 
-    def seconds_until_next_open(self) -> int:
+    def seconds_until_next_open(self, now: Optional[datetime] = None) -> int:
         """
         Calcula quantos segundos faltam até a próxima abertura.
 
         Útil para fazer sleep inteligente no modo standby.
 
+        Args:
+            now: Horário atual no fuso do mercado (padrão: datetime.now(self.tz))
+
         Retorna:
             0 se o mercado já está aberto
             Número de segundos até a próxima abertura
         """
-        if self.is_market_open():
-            return 0
+        return self.evaluate(now)[1]
+
+    def evaluate(self, now: Optional[datetime] = None) -> Tuple[MarketStatus, int]:
+        """
+        Calcula o status e os segundos até a próxima abertura numa única passada.
+
+        Args:
+            now: Horário atual no fuso do mercado (padrão: datetime.now(self.tz))
+
+        Retorna:
+            (status, segundos até a próxima abertura; 0 se o mercado está aberto)
+        """
+        if now is None:
+            now = datetime.now(self.tz)
 
-        now = datetime.now(self.tz)
+        status = self.get_status(now)
+        if status is MarketStatus.OPEN:
+            return status, 0
+
+        if self._cached_next_open is None or now >= self._cached_next_open:
+            self._cached_next_open = self._compute_next_open(now)
+
+        return status, int((self._cached_next_open - now).total_seconds())
+
+    def _compute_next_open(self, now: datetime) -> datetime:
+        """
+        Calcula o datetime da próxima abertura a partir de `now`.
+
+        Args:
+            now: Horário atual no fuso do mercado.
+
+        Retorna:
+            datetime da próxima abertura (no mesmo fuso)
+        """
         weekday = now.weekday()
 
         # Calcula dias até o dia de abertura (domingo)
@@ -115,6 +157,4 @@ class MarketHoursChecker:
 
         # Calcula o datetime da próxima abertura
         next_open = now.replace(hour=self.open_hour, minute=self.open_minute, second=0, microsecond=0)
-        next_open += timedelta(days=days_until_open)
-
-        return int((next_open - now).total_seconds())
+        return next_open + timedelta(days=days_until_open)
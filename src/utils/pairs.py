@@ -0,0 +1,81 @@
+"""
+Lista de pares configurados para o bot.
+
+Lê config/_pairs_frozen.py (literal Python gerado a partir de
+config/pairs.yml, importado sem custo de parsing). O módulo não é
+versionado: é gerado apenas no build da imagem Docker
+(python -m src.utils.pairs). Se ainda não foi gerado, ou se o YAML foi
+alterado depois da geração, recorre ao config/pairs.yml.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+PAIRS_FILE = "config/pairs.yml"
+FROZEN_PAIRS_FILE = "config/_pairs_frozen.py"
+LINE_LENGTH = 150  # line-length do ruff (pyproject.toml)
+
+
+def _read_yaml(pairs_file: str) -> List[Dict[str, str]]:
+    """Lê a lista de pares do YAML."""
+    import yaml
+
+    with open(pairs_file, "r") as f:
+        return yaml.safe_load(f)["pairs"]
+
+
+def _is_frozen_current(pairs_file: str, frozen_file: str) -> bool:
+    """True se o módulo congelado existe e não é mais antigo que o YAML."""
+    try:
+        return os.path.getmtime(frozen_file) >= os.path.getmtime(pairs_file)
+    except OSError:
+        return False
+
+
+def load_pairs(pairs_file: str = PAIRS_FILE) -> List[Dict[str, str]]:
+    """
+    Retorna os pares configurados (symbol, env_file).
+
+    Args:
+        pairs_file: YAML de origem (usado quando o módulo congelado falta ou está desatualizado).
+
+    Returns:
+        Lista de dicionários no formato de config/pairs.yml.
+    """
+    if _is_frozen_current(pairs_file, FROZEN_PAIRS_FILE):
+        try:
+            from config._pairs_frozen import PAIRS
+
+            return PAIRS
+        except ImportError:
+            pass
+
+    return _read_yaml(pairs_file)
+
+
+def freeze_pairs(pairs: List[Dict[str, str]], pairs_file: str = PAIRS_FILE, frozen_file: str = FROZEN_PAIRS_FILE) -> None:
+    """
+    Grava a lista de pares como módulo Python (já no formato do ruff).
+
+    Args:
+        pairs: Pares lidos de pairs_file.
+        pairs_file: YAML de origem (citado no cabeçalho).
+        frozen_file: Módulo gerado.
+    """
+    # Os valores de pairs.yml são strings: json.dumps gera literais Python válidos com aspas duplas
+    items = [json.dumps(pair, ensure_ascii=False) for pair in pairs]
+    lines = [f"# Gerado a partir de {pairs_file} (python -m src.utils.pairs). Não editar."]
+
+    one_line = f"PAIRS = [{', '.join(items)}]"
+    if len(one_line) <= LINE_LENGTH:
+        lines.append(one_line)
+    else:
+        lines += ["PAIRS = [", *(f"    {item}," for item in items), "]"]
+
+    with open(frozen_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    freeze_pairs(_read_yaml(PAIRS_FILE))
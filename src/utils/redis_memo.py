@@ -0,0 +1,85 @@
+"""
+Memoização assíncrona com TTL em Redis.
+
+Compartilha respostas caras da exchange (ex: load_markets) entre todos os
+containers de bot. Sem REDIS_URL configurado ou sem o pacote redis
+instalado, o decorador apenas executa o método original.
+"""
+
+import functools
+import gzip
+import json
+from typing import Any, Callable, Optional
+
+from src.core.settings import settings
+from src.utils.logger import get_logger
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Dependência opcional
+    aioredis = None
+
+_log_redis = get_logger("bot.redis_memo")
+_client: Optional[Any] = None
+
+
+def _get_client() -> Optional[Any]:
+    """Retorna o cliente Redis compartilhado, ou None se o cache estiver desativado."""
+    global _client
+
+    if _client is None and aioredis is not None and settings.redis_url:
+        _client = aioredis.Redis.from_url(settings.redis_url)
+    return _client
+
+
+def redis_memoize(ttl: int, key: Callable[..., str]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorador que memoiza o resultado de uma corrotina no Redis.
+
+    O valor é armazenado como JSON comprimido (gzip) com expiração de `ttl`
+    segundos. Falhas do Redis nunca interrompem o bot: o método original é
+    executado normalmente.
+
+    Args:
+        ttl: Tempo de vida da entrada em segundos.
+        key: Função que recebe os mesmos argumentos do método e retorna a chave.
+
+    Returns:
+        Decorador para corrotinas cujo resultado seja serializável em JSON.
+
+    Exemplo:
+        @redis_memoize(ttl=3600, key=lambda self, exchange: f"markets:{exchange.id}")
+        async def _load_markets(self, exchange) -> dict:
+            return {"markets": await exchange.load_markets(), "currencies": exchange.currencies}
+    """
+
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            client = _get_client()
+            if client is None:
+                return await method(*args, **kwargs)
+
+            cache_key = key(*args, **kwargs)
+
+            try:
+                cached = await client.get(cache_key)
+                if cached is not None:
+                    _log_redis.debug("Cache hit: %s", cache_key)
+                    return json.loads(gzip.decompress(cached))
+            except Exception as exc:
+                _log_redis.warning("Falha ao ler %s do Redis: %s", cache_key, exc)
+
+            result = await method(*args, **kwargs)
+
+            try:
+                await client.set(cache_key, gzip.compress(json.dumps(result).encode("utf-8")), ex=ttl)
+                _log_redis.debug("Cache atualizado: %s (TTL %ss)", cache_key, ttl)
+            except Exception as exc:
+                _log_redis.warning("Falha ao gravar %s no Redis: %s", cache_key, exc)
+
+            return result
+
+        return wrapper
+
+    return decorator